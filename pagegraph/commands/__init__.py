@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 from abc import ABC
-import json
 from typing import TYPE_CHECKING
 
-from pagegraph.serialize import ReportBase, to_jsonable
+import orjson
+
+from pagegraph.serialize import ReportBase, report_to_jsonable
 
 if TYPE_CHECKING:
     from pathlib import Path
     from typing import Union, Sequence, Optional
 
     from pagegraph.graph import PageGraph
-    from pagegraph.types import Url, PageGraphId, PageGraphNodeId
+    from pagegraph.types import FrameId, Url, PageGraphId, PageGraphNodeId
 
 
 # pylint: disable=too-few-public-methods
@@ -28,7 +29,12 @@ class Result:
         self.url = pg.url
         self.report = report
 
-    def to_json(self) -> str:
+    def to_json(self) -> bytes:
+        report: Union[ReportBase, list[ReportBase]]
+        if isinstance(self.report, ReportBase):
+            report = self.report
+        else:
+            report = [x for x in self.report if x is not None]
         data = {
             "meta": {
                 "versions": {
@@ -37,9 +43,13 @@ class Result:
                 },
                 "url": self.url
             },
-            "report": to_jsonable(self.report)
+            "report": report
         }
-        return json.dumps(data)
+        # Reports are converted as orjson walks them, through
+        # `report_to_jsonable`, instead of in a separate pass beforehand.
+        return orjson.dumps(
+            data, default=report_to_jsonable,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS)
 
 
 def validate_node_id(node_id: PageGraphNodeId) -> bool:
@@ -55,6 +65,23 @@ def validate_pg_id(pg_id: PageGraphId) -> bool:
     return True
 
 
+def frame_id_for_domroot_id(pg: PageGraph,
+                            node_id: PageGraphNodeId) -> Optional[FrameId]:
+    """Returns the Blink frame id for the DOM root node with the given id,
+    if that DOM root is the node PageGraph uses for that frame id (i.e.,
+    if `pg.domroot_for_frame_id()` would return it). Otherwise, returns
+    None, since nothing could be attributed to that frame."""
+    if not pg.graph.has_node(node_id):
+        return None
+    domroot_node = pg.node(node_id).as_domroot_node()
+    if domroot_node is None:
+        return None
+    frame_id = domroot_node.frame_id()
+    if pg.domroot_for_frame_id(frame_id) != domroot_node:
+        return None
+    return frame_id
+
+
 class Base(ABC):
     input_path: Path
     debug: bool
@@ -72,5 +99,5 @@ class Base(ABC):
     def execute(self) -> Result:
         raise NotImplementedError()
 
-    def format(self, result: Result) -> Optional[str]:
+    def format(self, result: Result) -> bytes:
         return result.to_json()
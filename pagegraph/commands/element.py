@@ -13,11 +13,13 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Optional, Union
 
+    from networkx import MultiDiGraph
+
     from pagegraph.serialize import ScriptReport, BasicReport, FrameReport
     from pagegraph.types import PageGraphId
 
 
-@dataclass
+@dataclass(slots=True)
 class BytesWrittenResult(ReportBase):
     num_bytes: int
 
@@ -45,9 +47,7 @@ class Command(pagegraph.commands.Base):
             target_node = pg.node(self.pg_id)
             if self.output_path:
                 subgraph = target_node.subgraph(self.depth)
-                text = "\n".join(list(networkx.generate_graphml(subgraph)))
-                num_bytes = self.output_path.write_text(text)
-                report = BytesWrittenResult(num_bytes)
+                report = self.write_subgraph(subgraph)
                 return pagegraph.commands.Result(pg, report)
 
             node_report = target_node.to_node_report(self.depth)
@@ -56,10 +56,16 @@ class Command(pagegraph.commands.Base):
         target_edge = pg.edge(self.pg_id)
         if self.output_path:
             subgraph = target_edge.subgraph(self.depth)
-            text = "\n".join(list(networkx.generate_graphml(subgraph)))
-            num_bytes = self.output_path.write_text(text)
-            report = BytesWrittenResult(num_bytes)
+            report = self.write_subgraph(subgraph)
             return pagegraph.commands.Result(pg, report)
 
         edge_report = target_edge.to_edge_report(self.depth)
         return pagegraph.commands.Result(pg, edge_report)
+
+    def write_subgraph(self, subgraph: MultiDiGraph) -> BytesWrittenResult:
+        # Let NetworkX stream the GraphML straight to the file, instead of
+        # building the whole document as a string in memory first.
+        assert self.output_path
+        with self.output_path.open("wb") as handle:
+            networkx.write_graphml(subgraph, handle)
+        return BytesWrittenResult(self.output_path.stat().st_size)
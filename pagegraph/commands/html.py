@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from pagegraph.types import PageGraphNodeId
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(ReportBase):
     elements: list[DOMNodeReport]
 
@@ -41,18 +41,14 @@ class Command(pagegraph.commands.Base):
 
     def execute(self) -> pagegraph.commands.Result:
         pg = pagegraph.graph.from_path(self.input_path, self.debug)
-        dom_nodes = pg.dom_nodes()
-        reports = []
-        for node in dom_nodes:
-            if self.frame_filter:
-                domroot_for_insertion = node.domroot_for_document()
-                if not domroot_for_insertion:
-                    continue
-                if self.frame_filter != domroot_for_insertion.pg_id():
-                    continue
-            if self.at_serialization and not node.is_present_at_serialization():
-                continue
-            if self.only_body_content and not node.is_body_content():
-                continue
-            reports.append(node.to_report())
+        if self.frame_filter:
+            dom_nodes = pg.dom_nodes_for_document(self.frame_filter)
+        else:
+            dom_nodes = pg.dom_nodes()
+        reports = [
+            node.to_report() for node in dom_nodes
+            if ((not self.at_serialization or
+                 node.is_present_at_serialization()) and
+                (not self.only_body_content or node.is_body_content()))
+        ]
         return pagegraph.commands.Result(pg, Result(reports))
@@ -11,11 +11,14 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Optional, Union
 
+    from pagegraph.graph import PageGraph
+    from pagegraph.graph.edge.js_call import JSCallEdge
+    from pagegraph.graph.js import JSCallResult
     from pagegraph.serialize import ScriptReport, BasicReport, JSCallResultReport
     from pagegraph.types import PageGraphId
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(ReportBase):
     caller: Union[ScriptReport, BasicReport]
     call: JSCallResultReport
@@ -47,22 +50,46 @@ class Command(pagegraph.commands.Base):
         pg = pagegraph.graph.from_path(self.input_path, self.debug)
         reports: list[Result] = []
 
-        js_structure_nodes = pg.js_structure_nodes()
-        for js_node in js_structure_nodes:
+        frame_call_edges = None
+        if self.frame_nid:
+            frame_call_edges = self.frame_call_edges(pg)
+
+        call_results: list[JSCallResult] = []
+        for js_node in pg.js_structure_nodes():
             if self.method and self.method not in js_node.name():
                 continue
-
+            if frame_call_edges is None:
+                call_results += js_node.call_results()
+                continue
             for call_result in js_node.call_results():
-                if (self.frame_nid and
-                        call_result.call_context().pg_id() != self.frame_nid):
-                    continue
-                if (self.cross_frame and
-                        not call_result.is_cross_frame_call()):
-                    continue
-                script_node = call_result.call.incoming_node()
-                if self.pg_id and script_node.pg_id() != self.pg_id:
-                    continue
-                call_report = call_result.to_report()
-                script_report = script_node.to_report()
-                reports.append(Result(script_report, call_report))
+                if call_result.call in frame_call_edges:
+                    call_results.append(call_result)
+
+        # Scripts usually make many calls, so only build each calling
+        # script's report once.
+        script_reports: dict[PageGraphId, Union[ScriptReport, BasicReport]] = {}
+        for call_result in call_results:
+            if (self.cross_frame and
+                    not call_result.is_cross_frame_call()):
+                continue
+            script_node = call_result.call.incoming_node()
+            if self.pg_id and script_node.pg_id() != self.pg_id:
+                continue
+            call_report = call_result.to_report()
+            script_id = script_node.pg_id()
+            if script_id not in script_reports:
+                script_reports[script_id] = script_node.to_report()
+            script_report = script_reports[script_id]
+            reports.append(Result(script_report, call_report))
         return pagegraph.commands.Result(pg, reports)
+
+    def frame_call_edges(self, pg: PageGraph) -> set[JSCallEdge]:
+        # Only calls made in the given frame's context can match, so look
+        # those calls up by frame id, instead of checking the context of
+        # every call made in the graph.
+        assert self.frame_nid
+        frame_id = pagegraph.commands.frame_id_for_domroot_id(
+            pg, self.frame_nid)
+        if frame_id is None:
+            return set()
+        return set(pg.js_call_edges_for_frame_id(frame_id))
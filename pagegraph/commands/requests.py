@@ -12,10 +12,10 @@ if TYPE_CHECKING:
     from typing import Optional
 
     from pagegraph.serialize import RequestChainReport, FrameReport
-    from pagegraph.types import PageGraphNodeId
+    from pagegraph.types import FrameId, PageGraphNodeId
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(ReportBase):
     request: RequestChainReport
     frame: FrameReport
@@ -37,18 +37,32 @@ class Command(pagegraph.commands.Base):
     def execute(self) -> pagegraph.commands.Result:
         pg = pagegraph.graph.from_path(self.input_path, self.debug)
         results: list[Result] = []
+        # Many requests are made from the same frame, so only build each
+        # frame's report once.
+        frame_reports: dict[FrameId, FrameReport] = {}
+
+        # Resolve the frame filter to a frame id once, so each request
+        # can be checked with an int comparison, before looking up its frame.
+        target_frame_id = None
+        if self.frame_nid:
+            target_frame_id = pagegraph.commands.frame_id_for_domroot_id(
+                pg, self.frame_nid)
+            if target_frame_id is None:
+                return pagegraph.commands.Result(pg, results)
 
         for request_start_edge in pg.request_start_edges():
             request_frame_id = request_start_edge.frame_id()
-            request_frame = pg.domroot_for_frame_id(request_frame_id)
-
-            if self.frame_nid and request_frame.pg_id() != self.frame_nid:
+            if (target_frame_id is not None and
+                    request_frame_id != target_frame_id):
                 continue
+            request_frame = pg.domroot_for_frame_id(request_frame_id)
             request_id = request_start_edge.request_id()
             request_chain = pg.request_chain_for_id(request_id)
 
             request_chain_report = request_chain.to_report()
-            frame_report = request_frame.to_report()
+            if request_frame_id not in frame_reports:
+                frame_reports[request_frame_id] = request_frame.to_report()
+            frame_report = frame_reports[request_frame_id]
             report = Result(request_chain_report, frame_report)
             results.append(report)
         return pagegraph.commands.Result(pg, results)
@@ -11,11 +11,13 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Optional, Union
 
+    from pagegraph.graph import PageGraph
+    from pagegraph.graph.node.script_local import ScriptLocalNode
     from pagegraph.serialize import ScriptReport, BasicReport, FrameReport
-    from pagegraph.types import PageGraphId, PageGraphNodeId
+    from pagegraph.types import FrameId, PageGraphId, PageGraphNodeId
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(ReportBase):
     script: ScriptReport
     frame: Optional[FrameReport] = None
@@ -46,20 +48,34 @@ class Command(pagegraph.commands.Base):
     def execute(self) -> pagegraph.commands.Result:
         pg = pagegraph.graph.from_path(self.input_path, self.debug)
         reports: list[Result] = []
-        for script_node in pg.script_local_nodes():
-            if self.pg_id and script_node.pg_id() != self.pg_id:
+        # Many scripts run in the same frame, so only build each frame's
+        # report once.
+        frame_reports: dict[FrameId, FrameReport] = {}
+        for script_node in self.script_nodes(pg):
+            # Check the frame filter before building the script's report,
+            # since the report can include the script's full source.
+            frame_id = script_node.execute_edge().frame_id()
+            if self.frame_nid and ("n" + str(frame_id)) != self.frame_nid:
                 continue
 
             script_report = script_node.to_report(self.include_source)
             report = Result(script_report)
-
-            frame_id = script_node.execute_edge().frame_id()
-            if self.frame_nid and ("n" + str(frame_id)) != self.frame_nid:
-                continue
-            frame_report = pg.domroot_for_frame_id(frame_id).to_report()
-            report.frame = frame_report
+            if frame_id not in frame_reports:
+                frame_reports[frame_id] = (
+                    pg.domroot_for_frame_id(frame_id).to_report())
+            report.frame = frame_reports[frame_id]
 
             if self.omit_executors:
                 report.script.executor = None
             reports.append(report)
         return pagegraph.commands.Result(pg, reports)
+
+    def script_nodes(self, pg: PageGraph) -> list[ScriptLocalNode]:
+        if not self.pg_id:
+            return pg.script_local_nodes()
+        # If we're only looking for one script, look it up directly,
+        # instead of checking every script in the graph.
+        if not pg.graph.has_node(self.pg_id):
+            return []
+        script_node = pg.node(self.pg_id).as_script_local_node()
+        return [script_node] if script_node else []
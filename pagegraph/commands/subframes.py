@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from pagegraph.serialize import DOMElementReport, FrameReport
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(ReportBase):
     parent_frame: FrameReport
     iframe: DOMElementReport
@@ -32,29 +32,18 @@ class Command(pagegraph.commands.Base):
     def execute(self) -> pagegraph.commands.Result:
         pg = pagegraph.graph.from_path(self.input_path, self.debug)
         results: list[Result] = []
-        for iframe_node in pg.iframe_nodes():
+        for iframe_node in pg.iframe_nodes_for_party(self.party_filter):
             if (self.local_only and
                 not iframe_node.is_security_origin_inheriting()):
                 continue
 
             child_domroot_nodes = iframe_node.child_domroot_nodes()
-            if (self.party_filter != PartyFilterOption.NONE and
-                    len(child_domroot_nodes) == 0):
-                continue
-
-            if (self.party_filter == PartyFilterOption.FIRST_PARTY and
-                    iframe_node.is_third_party_to_root()):
-                continue
-
-            if (self.party_filter == PartyFilterOption.THIRD_PARTY and
-                    not iframe_node.is_third_party_to_root()):
-                continue
-
             parent_frame_report = iframe_node.execution_context().to_report()
             iframe_elm_report = iframe_node.to_report()
-            child_frame_reports: list[FrameReport] = []
-            for child_domroot in child_domroot_nodes:
-                child_frame_reports.append(child_domroot.to_report())
+            child_frame_reports: list[FrameReport] = [
+                child_domroot.to_report()
+                for child_domroot in child_domroot_nodes
+            ]
 
             subframe_report = Result(parent_frame_report, iframe_elm_report,
                                      child_frame_reports)
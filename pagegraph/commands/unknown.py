@@ -7,7 +7,7 @@ import pagegraph.graph
 from pagegraph.serialize import ReportBase
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(ReportBase):
     count: int
 
@@ -18,5 +18,5 @@ class Command(pagegraph.commands.Base):
         count = 0
         unknown_node = pg.unknown_node()
         if unknown_node:
-            count = len(list(unknown_node.outgoing_edges()))
+            count = unknown_node.outgoing_edge_count()
         return pagegraph.commands.Result(pg, Result(count))
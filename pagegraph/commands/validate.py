@@ -7,7 +7,7 @@ import pagegraph.graph
 from pagegraph.serialize import ReportBase
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(ReportBase):
     success: bool
 
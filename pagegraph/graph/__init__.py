@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from itertools import chain
 from pathlib import Path
 import sys
@@ -10,11 +10,12 @@ import networkx as NWX
 from packaging.version import Version
 
 import pagegraph
-from pagegraph.graph.edge import Edge
+from pagegraph.graph.edge import Edge, EDGE_TYPE_ATTR, edge_type_for_name
 from pagegraph.graph.node import Node
 from pagegraph.graph.requests import request_chain_for_edge
 from pagegraph.graph.type_map import edge_for_type, node_for_type
 from pagegraph.graphml import load_from_path
+from pagegraph.types import PartyFilterOption
 from pagegraph.versions import Feature
 from pagegraph.versions import min_version_for_feature
 
@@ -44,6 +45,7 @@ if TYPE_CHECKING:
     from pagegraph.types import BlinkId, EventListenerId, ChildDomNode
     from pagegraph.types import FrameId, RequestId, Url, PageGraphInput
     from pagegraph.types import PageGraphId, NetworkXEdgeId, NetworkXNodeId
+    from pagegraph.types import PageGraphNodeId
 
 
 class PageGraph:
@@ -126,12 +128,17 @@ class PageGraph:
     frame root (e.g., usually the Blink id for`window.document.documentElement),
     to the node representing that element in the PageGraph graph."""
 
+    __feature_support: dict[Feature, bool]
+    """Private cache mapping from each graph feature that's been checked,
+    to whether this graph's version supports that feature."""
+
     def __init__(self, input_data: PageGraphInput, debug: bool = False):
         self.debug = debug
         self.url = input_data.url
         self.graph_version = input_data.version
         self.graph = input_data.graph
         self.r_graph = input_data.reverse_graph
+        self.__feature_support = {}
 
         for node_type in Node.Types:
             self.__nodes_by_type[node_type] = []
@@ -198,10 +205,16 @@ class PageGraph:
             remove_events.append(remove_edge)
 
     def feature_check(self, feature: Feature) -> bool:
+        # This is called for many nodes and edges, so only compare
+        # versions once per feature.
+        if feature in self.__feature_support:
+            return self.__feature_support[feature]
         if self.graph_version is None:
             return False
         min_graph_version = min_version_for_feature(feature)
-        return self.graph_version >= min_graph_version
+        is_supported = self.graph_version >= min_graph_version
+        self.__feature_support[feature] = is_supported
+        return is_supported
 
     def unattributed_requests(self) -> list[RequestChain]:
         prefetched_requests = []
@@ -296,6 +309,26 @@ class PageGraph:
             nodes += self.nodes_of_type(node_type)
         return cast(list["DOMElementNode"], nodes)
 
+    @cached_property
+    def __dom_nodes_by_document(
+            self) -> dict[PageGraphNodeId, list[DOMElementNode]]:
+        """Private, lazily built cache mapping from the PageGraph id of each
+        DOM root node, to the DOM nodes most recently inserted into that
+        document."""
+        dom_nodes_by_document: dict[PageGraphNodeId, list[DOMElementNode]] = {}
+        for node in self.dom_nodes():
+            if domroot_node := node.domroot_for_document():
+                document_nodes = dom_nodes_by_document.setdefault(
+                    domroot_node.pg_id(), [])
+                document_nodes.append(node)
+        return dom_nodes_by_document
+
+    def dom_nodes_for_document(
+            self, domroot_id: PageGraphNodeId) -> list[DOMElementNode]:
+        """Returns the DOM nodes whose `domroot_for_document()` is the
+        DOM root node with the given PageGraph id."""
+        return self.__dom_nodes_by_document.get(domroot_id, [])
+
     def parent_dom_nodes(self) -> list[ParentDOMElementNode]:
         node_types = [
             Node.Types.DOM_ROOT,
@@ -331,6 +364,25 @@ class PageGraph:
         node_iterator = self.nodes_of_type(Node.Types.HTML)
         return cast(list["HTMLNode"], node_iterator)
 
+    @cached_property
+    def __html_nodes_by_tag(self) -> dict[str, list[HTMLNode]]:
+        """Private, lazily built cache mapping from a tag name (e.g., "P"), to
+        all the HTML element nodes in the graph with that tag name."""
+        html_nodes_by_tag: dict[str, list[HTMLNode]] = {}
+        tag_attr = Node.RawAttrs.TAG.value
+        for html_node in self.html_nodes():
+            # Read the tag straight from the NetworkX node data, to
+            # skip the method dispatch for each node in the graph.
+            node_tag = self.graph.nodes[html_node.pg_id()][tag_attr]
+            tag_nodes = html_nodes_by_tag.setdefault(node_tag, [])
+            tag_nodes.append(html_node)
+        return html_nodes_by_tag
+
+    def html_nodes_by_tag(self, tag_name: str) -> list[HTMLNode]:
+        """Returns all HTML element nodes with the given tag name
+        (e.g., "P" or "SCRIPT")."""
+        return self.__html_nodes_by_tag.get(tag_name, [])
+
     def parser_nodes(self) -> list[ParserNode]:
         node_iterator = self.nodes_of_type(Node.Types.PARSER)
         return cast(list["ParserNode"], node_iterator)
@@ -357,6 +409,23 @@ class PageGraph:
         edge_iterator = self.edges_of_type(Edge.Types.JS_CALL)
         return cast(list["JSCallEdge"], edge_iterator)
 
+    @cached_property
+    def __js_calls_by_frame_id(self) -> dict[FrameId, list[JSCallEdge]]:
+        """Private, lazily built cache mapping from the Blink assigned integer
+        id for each frame, to the JS call edges for calls made in that frame's
+        context."""
+        js_calls_by_frame_id: dict[FrameId, list[JSCallEdge]] = {}
+        for call_edge in self.js_call_edges():
+            frame_calls = js_calls_by_frame_id.setdefault(
+                call_edge.frame_id(), [])
+            frame_calls.append(call_edge)
+        return js_calls_by_frame_id
+
+    def js_call_edges_for_frame_id(self, frame_id: FrameId) -> list[JSCallEdge]:
+        """Returns the JS call edges for calls made in the context of the
+        frame with the given (Blink assigned) id."""
+        return self.__js_calls_by_frame_id.get(frame_id, [])
+
     def child_dom_nodes(
             self, parent_node: ParentDOMElementNode) -> Optional[list[ChildDomNode]]:
         """Returns all nodes that were ever a child of the parent node,
@@ -385,8 +454,8 @@ class PageGraph:
         parent_id, child_id = self.__edge_id_cache[edge_id]
         edge_key = (parent_id, child_id, edge_id)
         edge_data = self.graph.edges[edge_key]
-        edge_type_str = edge_data[Edge.RawAttrs.TYPE.value]
-        edge_type = Edge.Types(edge_type_str)
+        edge_type_str = edge_data[EDGE_TYPE_ATTR]
+        edge_type = edge_type_for_name(edge_type_str)
         edge = edge_for_type(edge_type, self, edge_id, parent_id, child_id)
 
         if insert_edge := edge.as_insert_edge():
@@ -405,13 +474,51 @@ class PageGraph:
                 nodes.append(node)
         return nodes
 
+    @cached_property
+    def __iframe_nodes_by_party(
+            self) -> dict[PartyFilterOption, list[FrameOwnerNode]]:
+        """Private, lazily built cache mapping from each party filter option,
+        to the iframe nodes that pass that filter."""
+        iframe_nodes = self.iframe_nodes()
+        first_party_nodes = []
+        third_party_nodes = []
+        for iframe_node in iframe_nodes:
+            if len(iframe_node.child_domroot_nodes()) == 0:
+                continue
+            if iframe_node.is_third_party_to_root():
+                third_party_nodes.append(iframe_node)
+            else:
+                first_party_nodes.append(iframe_node)
+        return {
+            PartyFilterOption.NONE: iframe_nodes,
+            PartyFilterOption.FIRST_PARTY: first_party_nodes,
+            PartyFilterOption.THIRD_PARTY: third_party_nodes,
+        }
+
+    def iframe_nodes_for_party(
+            self, party_filter: PartyFilterOption) -> list[FrameOwnerNode]:
+        """Returns the iframe nodes that pass the given party filter.
+        Filtering by party only returns iframes that ever contained a
+        document, and an iframe is third-party if any document it
+        contained was third-party to the top-level document."""
+        return self.__iframe_nodes_by_party[party_filter]
+
+    @cached_property
+    def __elements_by_id(self) -> dict[str, list[ParentDOMElementNode]]:
+        """Private, lazily built cache mapping from an element id attribute
+        value, to all the elements that had that id at serialization."""
+        elements_by_id: dict[str, list[ParentDOMElementNode]] = {}
+        for node in self.parent_dom_nodes():
+            node_id_attr = node.get_attribute("id")
+            if node_id_attr is None:
+                continue
+            id_elements = elements_by_id.setdefault(str(node_id_attr), [])
+            id_elements.append(node)
+        return elements_by_id
+
     def get_elements_by_id(self, id_attr: str) -> list[ParentDOMElementNode]:
         """Returns all elements that had the given id at serialization."""
-        elements = []
-        for node in self.parent_dom_nodes():
-            if node.get_attribute("id") == id_attr:
-                elements.append(node)
-        return elements
+        return self.__elements_by_id.get(id_attr, [])
 
     def get_elements_by_id_ever(self, id_attr: str) -> list[ParentDOMElementNode]:
         """Returns any element that ever had the given id.
@@ -426,12 +533,26 @@ class PageGraph:
                 elements.append(node)
         return elements
 
+    @cached_property
+    def __toplevel_domroot_nodes(self) -> tuple[DOMRootNode, ...]:
+        """Private, lazily built cache of the DOM root nodes for top level
+        documents, in graph order."""
+        return tuple(
+            domroot_node for domroot_node in self.domroot_nodes()
+            if domroot_node.is_top_level_domroot())
+
     def toplevel_domroot_nodes(self) -> list[DOMRootNode]:
-        domroot_nodes = []
-        for domroot_node in self.domroot_nodes():
-            if domroot_node.is_top_level_domroot():
-                domroot_nodes.append(domroot_node)
-        return domroot_nodes
+        return list(self.__toplevel_domroot_nodes)
+
+    def toplevel_domroot_with_url_containing(
+            self, needle: str) -> Optional[DOMRootNode]:
+        """Returns the first top level DOM root node whose URL includes the
+        given string."""
+        for domroot_node in self.__toplevel_domroot_nodes:
+            url = domroot_node.url()
+            if url and needle in url:
+                return domroot_node
+        return None
 
     def print_warning(self, msg: str) -> None:
         if self.debug:
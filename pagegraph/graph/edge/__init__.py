@@ -60,6 +60,8 @@ if TYPE_CHECKING:
 
 class Edge(PageGraphElement, ABC):
 
+    __slots__ = ("incoming_node_id", "outgoing_node_id", "_edge_key", "_data")
+
     # Class properties
 
     incoming_node_type_names: Optional[list[str]] = None  # Node.Types
@@ -82,53 +84,29 @@ class Edge(PageGraphElement, ABC):
     That the type names given here are valid is checked at runtime when
     running with `debug=True`."""
 
-    __incoming_node_types: Optional[list[Node.Types]] = None
-    """Class property that is automatically populated at runtime, based on
-    the contents fo the class's `incoming_node_type_names` property; its
-    just replacing the string "names of the classes" in
-    `incoming_node_type_names` with references to the corresponding PageGraph
-    query class type.
-
-    Subclasses *should not* implement this; its generated and populated
-    automatically."""
-
-    __outgoing_node_types: Optional[list[Node.Types]] = None
-    """Class property that is automatically populated at runtime, based on
-    the contents fo the class's `outgoing_node_type_names` property; its
-    just replacing the string "names of the classes" in
-    `outgoing_node_type_names` with references to the corresponding PageGraph
-    query class type.
-
-    Subclasses *should not* implement this; its generated and populated
-    automatically."""
-
     @classmethod
-    def incoming_node_types(cls) -> Optional[list[Node.Types]]:
+    def incoming_node_types(cls) -> Optional[frozenset[Node.Types]]:
+        """Returns the node types in the class's `incoming_node_type_names`
+        property, resolved once per class, as a set so `validate()` can
+        check membership with a single hash lookup."""
         if cls.incoming_node_type_names is None:
             return None
-
-        if cls.__incoming_node_types:
-            return cls.__incoming_node_types
-
-        from pagegraph.graph.node import Node
-        cls.__incoming_node_types = []
-        for node_type_name in cls.incoming_node_type_names:
-            cls.__incoming_node_types.append(Node.Types(node_type_name))
-        return cls.__incoming_node_types
+        if cls not in INCOMING_NODE_TYPES_CACHE:
+            INCOMING_NODE_TYPES_CACHE[cls] = node_types_for_names(
+                cls.incoming_node_type_names)
+        return INCOMING_NODE_TYPES_CACHE[cls]
 
     @classmethod
-    def outgoing_node_types(cls) -> Optional[list[Node.Types]]:
+    def outgoing_node_types(cls) -> Optional[frozenset[Node.Types]]:
+        """Returns the node types in the class's `outgoing_node_type_names`
+        property, resolved once per class, as a set so `validate()` can
+        check membership with a single hash lookup."""
         if cls.outgoing_node_type_names is None:
             return None
-
-        if cls.__outgoing_node_types:
-            return cls.__outgoing_node_types
-
-        from pagegraph.graph.node import Node
-        cls.__outgoing_node_types = []
-        for node_type_name in cls.outgoing_node_type_names:
-            cls.__outgoing_node_types.append(Node.Types(node_type_name))
-        return cls.__outgoing_node_types
+        if cls not in OUTGOING_NODE_TYPES_CACHE:
+            OUTGOING_NODE_TYPES_CACHE[cls] = node_types_for_names(
+                cls.outgoing_node_type_names)
+        return OUTGOING_NODE_TYPES_CACHE[cls]
 
     # Instance properties
     incoming_node_id: PageGraphNodeId
@@ -139,6 +117,15 @@ class Edge(PageGraphElement, ABC):
     """The identifier for the outgoing node to this edge. Will be a string
     in the format of 'n<int>'."""
 
+    _edge_key: PageGraphEdgeKey
+    """The NetworkX identifier for this edge (the incoming node id, the
+    outgoing node id, and the edge's own id), built once when the edge
+    is created."""
+
+    _data: Optional[dict[str, str]]
+    """The NetworkX attribute dict for this edge, looked up the first time
+    it is needed."""
+
     class Types(Enum):
         ATTRIBUTE_DELETE = "delete attribute"
         ATTRIBUTE_SET = "set attribute"
@@ -187,6 +174,8 @@ class Edge(PageGraphElement, ABC):
                  parent_id: PageGraphNodeId, child_id: PageGraphNodeId):
         self.incoming_node_id = parent_id
         self.outgoing_node_id = child_id
+        self._edge_key = (parent_id, child_id, pagegraph_id)
+        self._data = None
         super().__init__(graph, pagegraph_id)
 
     def __str__(self) -> str:
@@ -195,13 +184,13 @@ class Edge(PageGraphElement, ABC):
     def to_edge_report(
             self, depth: int = 0,
             seen: None | set[Node | Edge] = None) -> EdgeReport:
-        if seen is None:
-            seen = set([self])
-
+        # If no caller passed a `seen` set, the only element seen so far is
+        # this edge, which neither end node can match, so there is no need
+        # to build a set just to check against it.
         incoming_node = self.incoming_node()
         incoming_node_report: Optional[NodeReport | BriefNodeReport | str] = None
         if incoming_node:
-            if incoming_node in seen:
+            if seen is not None and incoming_node in seen:
                 incoming_node_report = f"(recursion {incoming_node.pg_id()})"
             elif depth > 0:
                 incoming_node_report = incoming_node.to_node_report(depth - 1)
@@ -211,9 +200,9 @@ class Edge(PageGraphElement, ABC):
         outgoing_node = self.outgoing_node()
         outgoing_node_report: None | NodeReport | BriefNodeReport | str = None
         if outgoing_node:
-            if outgoing_node in seen:
+            if seen is not None and outgoing_node in seen:
                 outgoing_node_report = f"(recursion {outgoing_node.pg_id()})"
-            if depth > 0:
+            elif depth > 0:
                 outgoing_node_report = outgoing_node.to_node_report(depth - 1)
             else:
                 outgoing_node_report = outgoing_node.to_brief_report()
@@ -234,13 +223,13 @@ class Edge(PageGraphElement, ABC):
         return self.pg.node(self.outgoing_node_id)
 
     def type_name(self) -> str:
-        return self.data()[self.RawAttrs.TYPE.value]
+        return self.data()[EDGE_TYPE_ATTR]
 
     def edge_type(self) -> Edge.Types:
-        return self.Types(self.type_name())
+        return edge_type_for_name(self.type_name())
 
     def is_type(self, edge_type: Types) -> bool:
-        return self.data()[self.RawAttrs.TYPE.value] == edge_type.value
+        return self.data()[EDGE_TYPE_ATTR] == edge_type.value
 
     def as_insert_edge(self) -> Optional[NodeInsertEdge]:
         return None
@@ -326,10 +315,13 @@ class Edge(PageGraphElement, ABC):
         return None
 
     def data(self) -> dict[str, str]:
-        return cast(dict[str, str], self.pg.graph.edges[self.edge_key()])
+        if self._data is None:
+            self._data = cast(
+                dict[str, str], self.pg.graph.edges[self._edge_key])
+        return self._data
 
     def edge_key(self) -> PageGraphEdgeKey:
-        return self.incoming_node_id, self.outgoing_node_id, self._id
+        return self._edge_key
 
     def describe(self) -> str:
         in_node = self.incoming_node()
@@ -365,3 +357,40 @@ class Edge(PageGraphElement, ABC):
         incoming_node = self.incoming_node()
         outgoing_node = self.outgoing_node()
         return incoming_node.subgraph(depth, outgoing_node)
+
+
+# The GraphML attribute names read on the hottest paths (type checks on
+# every edge, and frame lookups), resolved once from the RawAttrs enum, so
+# that each read doesn't repeat the Enum member and `.value` lookups.
+EDGE_TYPE_ATTR = Edge.RawAttrs.TYPE.value
+EDGE_FRAME_ID_ATTR = Edge.RawAttrs.FRAME_ID.value
+
+
+# Private caches mapping from each Edge subclass, to the node types
+# resolved from its `incoming_node_type_names` and `outgoing_node_type_names`
+# properties. These are keyed by the class itself, so that a subclass
+# never picks up the types resolved for one of its parent classes.
+INCOMING_NODE_TYPES_CACHE: dict[type[Edge], frozenset[Node.Types]] = {}
+OUTGOING_NODE_TYPES_CACHE: dict[type[Edge], frozenset[Node.Types]] = {}
+
+
+def node_types_for_names(type_names: list[str]) -> frozenset[Node.Types]:
+    # Imported here to avoid a circular dependency between the node and
+    # edge modules.
+    from pagegraph.graph.node import Node
+    return frozenset(Node.Types(type_name) for type_name in type_names)
+
+
+EDGE_TYPE_BY_NAME: dict[str, Edge.Types] = {
+    member.value: member for member in Edge.Types}
+
+
+def edge_type_for_name(type_name: str) -> Edge.Types:
+    """Returns the edge type for the edge type name used in the GraphML
+    file. This is a plain dict lookup, instead of going through the
+    Enum constructor each time."""
+    try:
+        return EDGE_TYPE_BY_NAME[type_name]
+    except KeyError:
+        # Let the Enum raise its usual ValueError for unknown names.
+        return Edge.Types(type_name)
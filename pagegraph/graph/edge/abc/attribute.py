@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 class AttributeEdge(FrameIdAttributedEdge, ABC):
 
+    __slots__ = ()
+
     incoming_node_type_names = [
         "script",  # Node.Types.SCRIPT_LOCAL
         "unknown actor",  # Node.Types.UNKNOWN
@@ -8,5 +8,7 @@ from pagegraph.graph.edge import Edge
 
 class EffectEdge(Edge, ABC):
 
+    __slots__ = ()
+
     def as_effect_edge(self) -> Optional[EffectEdge]:
         return self
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 
 class EventListenerEdge(Edge, ABC):
 
+    __slots__ = ()
+
     summary_methods = {
         "event_name": "event_name",
         "event_listener_id": "event_listener_id",
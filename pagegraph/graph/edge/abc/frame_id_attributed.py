@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC
 from typing import TYPE_CHECKING
 
-from pagegraph.graph.edge import Edge
+from pagegraph.graph.edge import Edge, EDGE_FRAME_ID_ATTR
 
 if TYPE_CHECKING:
     from pagegraph.graph.node.dom_root import DOMRootNode
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 class FrameIdAttributedEdge(Edge, ABC):
 
+    __slots__ = ()
+
     summary_methods = {
         "frame id": "frame_id",
     }
@@ -22,6 +24,6 @@ class FrameIdAttributedEdge(Edge, ABC):
 
     def frame_id(self) -> FrameId:
         if self.pg.debug:
-            if self.RawAttrs.FRAME_ID.value not in self.data():
+            if EDGE_FRAME_ID_ATTR not in self.data():
                 self.throw("No frame id recorded")
-        return int(self.data()[self.RawAttrs.FRAME_ID.value])
+        return int(self.data()[EDGE_FRAME_ID_ATTR])
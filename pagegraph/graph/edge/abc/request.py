@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 class RequestEdge(FrameIdAttributedEdge, ABC):
 
+    __slots__ = ()
+
     summary_methods = {
         "request id": "request_id",
     }
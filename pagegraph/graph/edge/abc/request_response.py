@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 class RequestResponseEdge(RequestEdge, ABC):
 
+    __slots__ = ()
+
     def incoming_node(self) -> ResourceNode:
         node = super().incoming_node()
         resource_node = node.as_resource_node()
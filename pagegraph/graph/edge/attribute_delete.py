@@ -7,5 +7,7 @@ from pagegraph.graph.edge.abc.attribute import AttributeEdge
 
 class AttributeDeleteEdge(AttributeEdge):
 
+    __slots__ = ()
+
     def as_attribute_delete_edge(self) -> Optional[AttributeDeleteEdge]:
         return self
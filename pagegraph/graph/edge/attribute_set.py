@@ -7,6 +7,8 @@ from pagegraph.graph.edge.abc.attribute import AttributeEdge
 
 class AttributeSetEdge(AttributeEdge):
 
+    __slots__ = ()
+
     summary_methods = {
         "value": "value",
     }
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 class CrossDOMEdge(Edge):
 
+    __slots__ = ()
+
     incoming_node_type_names = [
         "frame owner",  # Node.Types.FRAME_OWNER
     ]
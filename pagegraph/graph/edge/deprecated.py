@@ -2,4 +2,4 @@ from pagegraph.graph.edge import Edge
 
 
 class DeprecatedEdge(Edge):
-    pass
+    __slots__ = ()
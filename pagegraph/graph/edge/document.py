@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 class DocumentEdge(Edge):
 
+    __slots__ = ()
+
     def as_document_edge(self) -> Optional[DocumentEdge]:
         return self
 
@@ -8,5 +8,7 @@ from pagegraph.graph.edge.abc.frame_id_attributed import FrameIdAttributedEdge
 
 class EventListenerAddEdge(EventListenerEdge, FrameIdAttributedEdge):
 
+    __slots__ = ()
+
     def as_event_listener_add_edge(self) -> Optional[EventListenerAddEdge]:
         return self
@@ -7,5 +7,7 @@ from pagegraph.graph.edge.abc.event_listener import EventListenerEdge
 
 class EventListenerFiredEdge(EventListenerEdge):
 
+    __slots__ = ()
+
     def as_event_listener_fired_edge(self) -> Optional[EventListenerFiredEdge]:
         return self
@@ -8,5 +8,7 @@ from pagegraph.graph.edge.abc.frame_id_attributed import FrameIdAttributedEdge
 
 class EventListenerRemoveEdge(EventListenerEdge, FrameIdAttributedEdge):
 
+    __slots__ = ()
+
     def as_event_listener_remove_edge(self) -> Optional[EventListenerRemoveEdge]:
         return self
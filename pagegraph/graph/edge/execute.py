@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 class ExecuteEdge(FrameIdAttributedEdge):
 
+    __slots__ = ()
+
     incoming_node_type_names = [
         "HTML element",  # Node.Types.HTML
         "DOM root",  # Node.Types.DOCUMENT
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 class ExecuteFromAttributeEdge(ExecuteEdge):
 
+    __slots__ = ()
+
     incoming_node_type_names = [
         "DOM root",  # Node.Types.DOCUMENT
         "frame owner",  # Node.Types.FRAME_OWNER
@@ -7,23 +7,37 @@ from pagegraph.graph.edge import Edge
 from pagegraph.graph.edge.abc.frame_id_attributed import FrameIdAttributedEdge
 
 if TYPE_CHECKING:
+    from pagegraph.graph import PageGraph
     from pagegraph.graph.js import JSCallResult
     from pagegraph.graph.node.js_structure import JSStructureNode
     from pagegraph.graph.node.script_local import ScriptLocalNode
     from pagegraph.serialize import JSONAble
-    from pagegraph.types import JSCallingNode
+    from pagegraph.types import JSCallingNode, PageGraphNodeId, PageGraphEdgeId
 
 
 class JSCallEdge(FrameIdAttributedEdge):
 
+    __slots__ = ("_args",)
+
+    _args: JSONAble
+    """The decoded call arguments, or None until `args()` is first called."""
+
+    def __init__(self, graph: PageGraph, pagegraph_id: PageGraphEdgeId,
+                 parent_id: PageGraphNodeId, child_id: PageGraphNodeId):
+        self._args = None
+        super().__init__(graph, pagegraph_id, parent_id, child_id)
+
     def args(self) -> JSONAble:
+        # Edge objects are cached by the graph, so the arguments only need
+        # to be decoded once per edge.
+        if self._args is not None:
+            return self._args
         args_raw = self.data()[Edge.RawAttrs.ARGS.value]
-        return_result = None
         try:
-            return_result = loads(args_raw)
+            self._args = loads(args_raw)
         except JSONDecodeError:
-            return_result = args_raw
-        return return_result
+            self._args = args_raw
+        return self._args
 
     def as_js_call_edge(self) -> Optional[JSCallEdge]:
         return self
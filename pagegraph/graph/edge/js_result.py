@@ -8,18 +8,34 @@ from pagegraph.graph.edge.abc.frame_id_attributed import FrameIdAttributedEdge
 from pagegraph.serialize import JSONAble
 
 if TYPE_CHECKING:
+    from pagegraph.graph import PageGraph
     from pagegraph.graph.node.js_structure import JSStructureNode
-    from pagegraph.types import JSCallingNode
+    from pagegraph.types import JSCallingNode, PageGraphNodeId, PageGraphEdgeId
 
 
 class JSResultEdge(FrameIdAttributedEdge):
 
+    __slots__ = ("_value",)
+
+    _value: JSONAble
+    """The decoded return value, or None until `value()` is first called."""
+
+    def __init__(self, graph: PageGraph, pagegraph_id: PageGraphEdgeId,
+                 parent_id: PageGraphNodeId, child_id: PageGraphNodeId):
+        self._value = None
+        super().__init__(graph, pagegraph_id, parent_id, child_id)
+
     def value(self) -> JSONAble:
+        # Edge objects are cached by the graph, so the (possibly large)
+        # JSON value only needs to be decoded once per edge.
+        if self._value is not None:
+            return self._value
         value_raw = self.data()[Edge.RawAttrs.VALUE.value]
         try:
-            return cast(JSONAble, loads(value_raw))
+            self._value = cast(JSONAble, loads(value_raw))
         except JSONDecodeError:
-            return value_raw
+            self._value = value_raw
+        return self._value
 
     def as_js_result_edge(self) -> Optional[JSResultEdge]:
         return self
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 class NodeCreateEdge(FrameIdAttributedEdge):
 
+    __slots__ = ()
+
     incoming_node_type_names = [
         "parser",  # Node.Types.PARSER
         "script",  # Node.Types.SCRIPT_LOCAL
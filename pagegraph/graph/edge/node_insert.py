@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 class NodeInsertEdge(FrameIdAttributedEdge):
 
+    __slots__ = ()
+
     incoming_node_type_names = [
         "parser",  # Node.Types.PARSER
         "script",  # Node.Types.SCRIPT_LOCAL
@@ -6,6 +6,8 @@ from pagegraph.graph.edge.abc.frame_id_attributed import FrameIdAttributedEdge
 
 
 class NodeRemoveEdge(FrameIdAttributedEdge):
+    __slots__ = ()
+
     incoming_node_type_names = [
         "parser",  # TEMP
         "script",  # Node.Types.SCRIPT_LOCAL
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 class RequestErrorEdge(RequestResponseEdge):
 
+    __slots__ = ()
+
     incoming_node_type_names = [
         "resource",  # Node.Types.RESOURCE
     ]
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 class RequestStartEdge(RequestEdge):
 
+    __slots__ = ()
+
     incoming_node_type_names = [
         "DOM root",  # Node.Types.DOM_ROOT
         "HTML element",  # Node.Types.HTML
@@ -46,10 +48,7 @@ class RequestStartEdge(RequestEdge):
 
     def resource_type(self) -> ResourceType:
         resource_type_raw = self.data()[Edge.RawAttrs.RESOURCE_TYPE.value]
-        try:
-            return ResourceType(resource_type_raw)
-        except ValueError:
-            return ResourceType.OTHER
+        return ResourceType.from_str(resource_type_raw)
 
     def resource_type_name(self) -> str:
         return self.resource_type().value
@@ -6,5 +6,7 @@ from pagegraph.graph.edge import Edge
 
 
 class StorageBucketEdge(Edge):
+    __slots__ = ()
+
     def as_storage_bucket_edge(self) -> Optional[StorageBucketEdge]:
         return self
@@ -6,5 +6,7 @@ from pagegraph.graph.edge.abc.storage_call import StorageCallEdge
 
 
 class StorageClearEdge(StorageCallEdge):
+    __slots__ = ()
+
     def as_storage_clear_edge(self) -> Optional[StorageClearEdge]:
         return self
@@ -6,6 +6,8 @@ from pagegraph.graph.edge.abc.storage_call import StorageCallEdge
 
 
 class StorageDeleteEdge(StorageCallEdge):
+    __slots__ = ()
+
     def as_storage_delete_edge(self) -> Optional[StorageDeleteEdge]:
         return self
 
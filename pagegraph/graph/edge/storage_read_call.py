@@ -7,6 +7,8 @@ from pagegraph.graph.edge.abc.storage_call import StorageCallEdge
 
 
 class StorageReadCallEdge(StorageCallEdge):
+    __slots__ = ()
+
     def as_storage_read_call_edge(self) -> Optional[StorageReadCallEdge]:
         return self
 
@@ -7,6 +7,8 @@ from pagegraph.graph.edge.abc.frame_id_attributed import FrameIdAttributedEdge
 
 
 class StorageReadResultEdge(FrameIdAttributedEdge):
+    __slots__ = ()
+
     def as_storage_read_result_edge(self) -> Optional[StorageReadResultEdge]:
         return self
 
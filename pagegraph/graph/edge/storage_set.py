@@ -7,6 +7,8 @@ from pagegraph.graph.edge.abc.storage_call import StorageCallEdge
 
 
 class StorageSetEdge(StorageCallEdge):
+    __slots__ = ()
+
     def as_storage_set_dge(self) -> Optional[StorageSetEdge]:
         return self
 
@@ -8,6 +8,8 @@ from pagegraph.versions import Feature
 
 class StructureEdge(Edge):
 
+    __slots__ = ()
+
     # Note that the correct values for edges differs depending on
     # graph version.
     incoming_node_type_names = None
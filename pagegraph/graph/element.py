@@ -17,6 +17,10 @@ if TYPE_CHECKING:
 
 class PageGraphElement(ABC):
 
+    # Slotted, so that subclasses that also declare __slots__ (e.g., edges,
+    # which there are many of) don't carry a per-instance __dict__.
+    __slots__ = ("pg", "_id")
+
     class RawAttrs(Enum):
         TIMESTAMP = "timestamp"
         # Child classes should implement this enum with the PageGraph
@@ -120,6 +120,11 @@ class Node(PageGraphElement, ABC):
                 edges.append(self.pg.edge(edge_id))
         return edges
 
+    def outgoing_edge_count(self) -> int:
+        """Returns the number of outgoing edges, without loading the Edge
+        objects for each of them."""
+        return int(self.pg.graph.out_degree(self._id))
+
     def incoming_edges(self) -> Iterable[Edge]:
         edges: list[Edge] = []
         for _, edge_info in self.pg.r_graph.adj[self._id].items():
@@ -351,12 +356,19 @@ class Node(PageGraphElement, ABC):
         if other_node:
             node_ids.add(other_node.pg_id())
 
+        # Only the nodes added in the previous step can have neighbors
+        # that aren't already included, so only expand those.
+        frontier = set(node_ids)
         for _ in range(depth):
             neighbors: set[PageGraphId] = set()
-            for node_id in node_ids:
+            for node_id in frontier:
                 neighbors.update(self.pg.graph.neighbors(node_id))
-            node_ids.update(neighbors)
+            frontier = neighbors - node_ids
+            if not frontier:
+                break
+            node_ids.update(frontier)
 
+        # This is a read-only view of the graph, not a copy.
         return self.pg.graph.subgraph(node_ids)
 
 
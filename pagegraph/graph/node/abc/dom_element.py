@@ -10,11 +10,12 @@ from pagegraph.versions import Feature
 if TYPE_CHECKING:
     from pagegraph.graph.edge.node_create import NodeCreateEdge
     from pagegraph.graph.edge.node_insert import NodeInsertEdge
+    from pagegraph.graph import PageGraph
     from pagegraph.graph.node.abc.parent_dom_element import ParentDOMElementNode
     from pagegraph.graph.node.dom_root import DOMRootNode
     from pagegraph.graph.requests import RequestChain
     from pagegraph.serialize import DOMNodeReport, JSONAble
-    from pagegraph.types import BlinkId, ActorNode
+    from pagegraph.types import BlinkId, ActorNode, PageGraphId
 
 
 class DOMElementNode(Node, ABC):
@@ -23,6 +24,25 @@ class DOMElementNode(Node, ABC):
         "tag name": "tag_name"
     }
 
+    # Instance properties
+    __parent_at_serialization: Optional[ParentDOMElementNode]
+    """Private cache of the result of `parent_at_serialization()`, which
+    is walked repeatedly when checking ancestors (e.g., in
+    `is_body_content()` and `domroot_for_serialization()`)."""
+
+    __parent_at_serialization_computed: bool
+    """Whether `__parent_at_serialization` has been computed yet (since
+    `None` is a valid result)."""
+
+    __creation_edge: Optional[NodeCreateEdge]
+    """Private cache of the result of `creation_edge()`."""
+
+    def __init__(self, graph: PageGraph, pg_id: PageGraphId):
+        self.__parent_at_serialization = None
+        self.__parent_at_serialization_computed = False
+        self.__creation_edge = None
+        super().__init__(graph, pg_id)
+
     def as_dom_element_node(self) -> Optional[DOMElementNode]:
         return self
 
@@ -69,6 +89,15 @@ class DOMElementNode(Node, ABC):
         return parent_node_at_serialization is not None
 
     def parent_at_serialization(self) -> Optional[ParentDOMElementNode]:
+        # The graph isn't modified after it's loaded, so the parent only
+        # needs to be found once per node.
+        if not self.__parent_at_serialization_computed:
+            self.__parent_at_serialization = (
+                self.__find_parent_at_serialization())
+            self.__parent_at_serialization_computed = True
+        return self.__parent_at_serialization
+
+    def __find_parent_at_serialization(self) -> Optional[ParentDOMElementNode]:
         if self.pg.feature_check(Feature.DOCUMENT_EDGES):
             for edge in self.incoming_edges():
                 if document_edge := edge.as_document_edge():
@@ -85,12 +114,14 @@ class DOMElementNode(Node, ABC):
         return None
 
     def creation_edge(self) -> NodeCreateEdge:
-        creation_edge = None
-        for edge in self.incoming_edges():
-            if creation_edge := edge.as_create_edge():
-                break
-        assert creation_edge
-        return creation_edge
+        if self.__creation_edge is None:
+            creation_edge = None
+            for edge in self.incoming_edges():
+                if creation_edge := edge.as_create_edge():
+                    break
+            assert creation_edge
+            self.__creation_edge = creation_edge
+        return self.__creation_edge
 
     def creator_node(self) -> ActorNode:
         return self.creation_edge().incoming_node()
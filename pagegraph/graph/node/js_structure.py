@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from pagegraph.graph.edge.js_result import JSResultEdge
 
 class JSStructureNode(Node, Reportable):
-    __cached_call_map: dict[JSCallEdge, JSCallResult] = {}
+    __cached_call_map: dict[JSCallEdge, JSCallResult]
 
     def to_report(self) -> JSStructureReport:
         return JSStructureReport(self.name(), self.type_name())
@@ -25,6 +25,7 @@ class JSStructureNode(Node, Reportable):
         return self.data()[self.RawAttrs.METHOD.value]
 
     def build_caches(self) -> None:
+        self.__cached_call_map = {}
         js_calls = self.incoming_edges()
         js_results = self.outgoing_edges()
         calls_and_results_unsorted = list(chain(js_calls, js_results))
@@ -24,6 +24,17 @@ if TYPE_CHECKING:
     from pagegraph.types import Url
 
 
+VERSION_MATCHER = re.compile(rb"<version>(\d+\.\d+\.\d+)<\/version>", re.ASCII)
+# The <version> tag is written in the graph's <desc> header, so only the
+# start of the file needs to be read to find it.
+VERSION_READ_CHUNK_SIZE = 16384
+VERSION_READ_MAX_SIZE = 1024 * 1024
+
+# Maps (path, modification time, size) for each graphml file whose version
+# has been read, to that version.
+VERSION_CACHE: dict[tuple[str, int, int], Version] = {}
+
+
 def url_from_graphml_file(input_path: Path) -> Url:
     xml_url_pattern = r'<desc>.*?<url>(.*?)</url>.*?</desc>'
     xml_url_matcher = re.compile(xml_url_pattern, flags=re.U)
@@ -46,18 +57,33 @@ def url_from_graphml_file(input_path: Path) -> Url:
 
 
 def pagegraph_version_from_graphml_file(input_path: Path) -> Version:
-    pattern = r"<version>(\d+\.\d+\.\d+)<\/version>"
+    # Key the cache on the file's modification time and size too, so
+    # that a graph regenerated at the same path is read again.
+    input_stat = input_path.stat()
+    cache_key = (str(input_path.resolve()), input_stat.st_mtime_ns,
+                 input_stat.st_size)
+    if cache_key in VERSION_CACHE:
+        return VERSION_CACHE[cache_key]
 
     graph_version = None
-    with input_path.open(encoding="utf8") as f:
-        for line in f:
-            match = re.search(pattern, line, re.ASCII)
+    head = b""
+    with input_path.open("rb") as f:
+        while len(head) < VERSION_READ_MAX_SIZE:
+            chunk = f.read(VERSION_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            # Start searching a little before the new chunk, in case the
+            # tag was split across two reads.
+            search_start = max(0, len(head) - 64)
+            head += chunk
+            match = VERSION_MATCHER.search(head, search_start)
             if match:
-                graph_version = parse(match.group(1))
+                graph_version = parse(match.group(1).decode("ascii"))
                 break
 
     if not graph_version:
         raise ValueError("Unable to determine version of PageGraph file at.")
+    VERSION_CACHE[cache_key] = graph_version
     return graph_version
 
 
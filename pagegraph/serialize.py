@@ -14,12 +14,12 @@ if TYPE_CHECKING:
     from packaging.version import Version
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportBase(ABC):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BasicReport(ReportBase):
     name: str
 
@@ -29,7 +29,7 @@ JSONAble = (
     float | bool | None)
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameReport(ReportBase):
     id: PageGraphId
     main_frame: bool
@@ -38,20 +38,20 @@ class FrameReport(ReportBase):
     blink_id: BlinkId
 
 
-@dataclass
+@dataclass(slots=True)
 class DOMElementReport(ReportBase):
     id: PageGraphId
     tag: str
     attrs: dict[str, JSONAble] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JSStructureReport(ReportBase):
     name: str
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class JSCallResultReport(ReportBase):
     method: str
     args: Any
@@ -60,13 +60,13 @@ class JSCallResultReport(ReportBase):
     execution_context: Optional[FrameReport] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestReport(ReportBase):
     id: PageGraphId
     url: Url | None
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestCompleteReport(ReportBase):
     id: PageGraphId
     size: int
@@ -75,14 +75,14 @@ class RequestCompleteReport(ReportBase):
     status: str = "complete"
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestErrorReport(ReportBase):
     id: PageGraphId
     headers: RequestHeaders | None
     status: str = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestChainReport(ReportBase):
     request_id: RequestId
     request_type: str
@@ -91,7 +91,7 @@ class RequestChainReport(ReportBase):
     result: RequestCompleteReport | RequestErrorReport | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptReport(ReportBase):
     id: PageGraphId
     type: str
@@ -101,7 +101,7 @@ class ScriptReport(ReportBase):
     executor: Union[DOMElementReport, ScriptReport, None] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementReport(ReportBase):
     id: PageGraphId
     type: str
@@ -114,14 +114,14 @@ BriefNodeReport = ElementReport
 BriefEdgeReport = ElementReport
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeReport(ElementReport):
     incoming_edges: list[Union[BriefEdgeReport, EdgeReport, str]]
     outgoing_edges: list[Union[BriefEdgeReport, EdgeReport, str]]
     kind: str = "node"
 
 
-@dataclass
+@dataclass(slots=True)
 class EdgeReport(ElementReport):
     incoming_node: Union[NodeReport, BriefNodeReport, str, None]
     outgoing_node: Union[NodeReport, BriefNodeReport, str, None]
@@ -163,3 +163,24 @@ def to_jsonable(data: JSONAble) -> Any:
         return jsonable_map
 
     return data
+
+
+def report_to_jsonable(report: ReportBase) -> dict[str, Any]:
+    """Shallow version of `to_jsonable` for a single report, for use as an
+    orjson `default` hook, so that nested reports are converted as orjson
+    reaches them, instead of building the whole tree up front.
+
+    List and dict values still go through `to_jsonable`, since orjson
+    serializes those itself, and so wouldn't drop their `None` values or
+    rename their keys."""
+    if not isinstance(report, ReportBase):
+        raise TypeError(f"Unable to serialize {type(report)}")
+    jsonable_map: dict[str, Any] = {}
+    for field in fields(report):
+        value = getattr(report, field.name)
+        if value is None:
+            continue
+        if isinstance(value, (list, dict)):
+            value = to_jsonable(value)
+        jsonable_map[report_field_name(field.name)] = value
+    return jsonable_map
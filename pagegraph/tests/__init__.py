@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 import unittest
 
 import pagegraph.graph
@@ -10,20 +10,40 @@ if TYPE_CHECKING:
     from pagegraph.graph import PageGraph
     from pagegraph.graph.edge import Edge
     from pagegraph.graph.node import Node
+    from pagegraph.graph.node.abc.parent_dom_element import ParentDOMElementNode
+    from pagegraph.graph.node.frame_owner import FrameOwnerNode
 
 
 class PageGraphBaseTestClass(unittest.TestCase, ABC):
     NAME = ""
     graph: "PageGraph"
+    iframes: tuple["FrameOwnerNode", ...]
 
-    def filter_nodes(self, nodes: list["Node"]) -> list["Node"]:
+    def filter_nodes(self, nodes: Iterable["Node"]) -> list["Node"]:
         return PG_FILTER.filter_artifact_nodes(self.graph, nodes)
 
-    def filter_edges(self, edges: list["Edge"]) -> list["Edge"]:
+    def filter_edges(self, edges: Iterable["Edge"]) -> list["Edge"]:
         return PG_FILTER.filter_artifact_edges(self.graph, edges)
 
-    def setUp(self) -> None:
-        if self.NAME == "":
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Tests only read from the graph, so parse it once per test class,
+        # instead of once per test method.
+        if cls.NAME == "":
             raise ValueError("Inheritors must define NAME")
-        graph_path = PG_PATHS.graphs() / (self.NAME + ".graphml")
-        self.graph = pagegraph.graph.from_path(graph_path)
+        graph_path = PG_PATHS.graphs() / (cls.NAME + ".graphml")
+        cls.graph = pagegraph.graph.from_path(graph_path)
+        cls.iframes = tuple(cls.graph.iframe_nodes())
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        # Let each class's graph be freed once its tests are done.
+        del cls.graph
+        del cls.iframes
+
+    def iframe_nodes(self) -> tuple["FrameOwnerNode", ...]:
+        return self.iframes
+
+    def frame_by_id(self, id_attr: str) -> "ParentDOMElementNode":
+        # Elements are already indexed by id attribute in the graph.
+        return self.graph.get_elements_by_id(id_attr)[0]
@@ -8,11 +8,8 @@ class AttributesBasicTestCase(PageGraphBaseTestClass):
     NAME = 'attrs-basic'
 
     def get_par_html_node(self) -> HTMLNode:
-        par_html_node = None
-        for html_node in self.graph.html_nodes():
-            if html_node.tag_name() == "P":
-                par_html_node = html_node
-                break
+        par_html_nodes = iter(self.graph.html_nodes_by_tag("P"))
+        par_html_node = next(par_html_nodes, None)
         self.assertIsNotNone(par_html_node)
         assert par_html_node
         return par_html_node
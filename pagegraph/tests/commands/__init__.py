@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import subprocess
 from typing import Optional
@@ -6,6 +7,11 @@ import pagegraph.tests.util.paths as PG_PATHS
 import pagegraph.tests.commands.cases as PG_CASES
 import pagegraph.tests.commands.crawl as PG_CRAWL
 import pagegraph.tests.commands.server as PG_SERVER
+import pagegraph.tests.commands.validate as PG_VALIDATE
+
+# Exit code unittest uses (since Python 3.12) when no tests were run, like
+# when none of the tests in a file match the `-k` filter.
+UNITTEST_NO_TESTS_RAN = 5
 
 
 def print_err(msg: str) -> None:
@@ -17,57 +23,87 @@ def serve(port: int, verbose: bool) -> None:
 
 
 def generate(tool_path: str, testcase_filter: None, port: int,
-             should_clear: bool, verbose: bool, other_args: list[str]) -> None:
+             should_clear: bool, verbose: bool, other_args: list[str],
+             max_workers: int = PG_CRAWL.DEFAULT_MAX_WORKERS) -> None:
     if should_clear:
         PG_CASES.clear_graphs()
 
     pg_crawl_dir = None
     try:
-        pg_crawl_dir = PG_CRAWL.validate_path(tool_path)
+        pg_crawl_dir = PG_VALIDATE.validate_path(tool_path)
     except ValueError as e:
         print_err("Invalid pagegraph-crawl path provided.")
         print_err(str(e))
         return
     assert pg_crawl_dir
 
-    test_cases = PG_CASES.matching_cases(testcase_filter)
+    jobs: list[PG_CRAWL.CrawlJob] = []
+    for test_case in PG_CASES.matching_cases(testcase_filter):
+        output_path = PG_CASES.graph_path_for_case(test_case)
+        if output_path.is_file():
+            print(f" - skipping bc {output_path} already exists")
+            continue
+        print(f" - generating graph for {test_case.name}")
+        input_url = PG_SERVER.url_for_case(test_case, port)
+        jobs.append((input_url, output_path))
 
-    handle = PG_SERVER.start(PG_PATHS.testcases(), port, verbose)
     try:
-        for test_case in test_cases:
-            output_path = PG_CASES.graph_path_for_case(test_case)
-            if output_path.is_file():
-                print(f" - skipping bc {output_path} already exists")
-                continue
-            print(f" - generating graph for {test_case.name}")
-            input_url = PG_SERVER.url_for_case(test_case, port)
-            PG_CRAWL.run(pg_crawl_dir, input_url, output_path, verbose,
-                         other_args)
-    except subprocess.CalledProcessError as e:
-        print_err("!!! Brave crashed")
+        with PG_SERVER.session_server(PG_PATHS.testcases(), port,
+                                      verbose) as server_handle:
+            try:
+                PG_CRAWL.run_many(pg_crawl_dir, jobs, verbose, other_args,
+                                  max_workers)
+            except subprocess.CalledProcessError as e:
+                print_err("!!! Brave crashed")
+                print_err(str(e))
+                print_err("Most recent test server output:")
+                for line in PG_SERVER.recent_stderr(server_handle):
+                    print_err(line.decode("utf8", errors="replace").rstrip())
+    except RuntimeError as e:
+        print_err("Unable to start the test server.")
         print_err(str(e))
-    PG_SERVER.shutdown(handle)
 
 
-def run(testcase_filter: Optional[str], verbose: bool) -> None:
+def run(testcase_filter: Optional[str], verbose: bool,
+        workers: int = 1) -> None:
     unittest_files: list[str] = []
     for child in PG_PATHS.unittests().iterdir():
         if not child.is_file() or child.name == "__init__.py":
             continue
         if child.name.startswith("."):
             continue
-        if verbose:
-            unittest_files += ["-v", str(child)]
-        else:
-            unittest_files.append(str(child))
+        unittest_files.append(str(child))
 
     simple_test_arg = [
         "/usr/bin/env", "python3",
         "-m", "unittest",
     ]
 
+    if verbose:
+        simple_test_arg.append("-v")
+
     if testcase_filter:
         simple_test_arg += ["-k", testcase_filter]
 
-    simple_test_arg += unittest_files
-    subprocess.run(simple_test_arg, check=True)
+    if workers <= 1:
+        subprocess.run(simple_test_arg + unittest_files, check=True)
+        return
+
+    # Otherwise, run each test file in its own process. Each test class only
+    # reads from its graph, so the files are independent of each other.
+    def run_file(test_file: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(simple_test_arg + [test_file],
+                              capture_output=True, text=True, check=False)
+
+    failed_result = None
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(run_file, unittest_files):
+            print(result.stdout, end="")
+            print(result.stderr, end="", file=sys.stderr)
+            if result.returncode in (0, UNITTEST_NO_TESTS_RAN):
+                continue
+            if failed_result is None:
+                failed_result = result
+    if failed_result is not None:
+        raise subprocess.CalledProcessError(failed_result.returncode,
+                                            failed_result.args)
@@ -1,4 +1,6 @@
+import os
 import pathlib
+from typing import Iterator
 
 import pagegraph.tests.util.paths as PG_PATHS
 
@@ -7,16 +9,15 @@ HTML_FILETYPE = ".html"
 GRAPH_FILETYPE = ".graphml"
 
 
-def matching_cases(test_filter: None | str = None) -> list[pathlib.Path]:
-    cases = []
-    for test_case in PG_PATHS.testcases().iterdir():
-        if not test_case.is_file():
-            continue
-        if not test_case.name.endswith(HTML_FILETYPE):
-            continue
-        if not test_filter or test_filter in test_case.name:
-            cases.append(test_case)
-    return cases
+def matching_cases(test_filter: None | str = None) -> Iterator[pathlib.Path]:
+    with os.scandir(PG_PATHS.testcases()) as entries:
+        for entry in entries:
+            if not entry.name.endswith(HTML_FILETYPE):
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if not test_filter or test_filter in entry.name:
+                yield pathlib.Path(entry.path)
 
 
 def graph_path_for_case(test_case: pathlib.Path) -> pathlib.Path:
@@ -25,6 +26,22 @@ def graph_path_for_case(test_case: pathlib.Path) -> pathlib.Path:
 
 
 def clear_graphs() -> None:
-    for graph in PG_PATHS.graphs().iterdir():
-        if graph.name.endswith(GRAPH_FILETYPE):
-            graph.unlink()
+    # Where the platform allows it, unlink relative to an open handle on the
+    # graphs directory, so each delete is a single unlinkat() call that
+    # doesn't need to re-resolve the directory path.
+    if os.unlink not in os.supports_dir_fd or os.scandir not in os.supports_fd:
+        for graph in PG_PATHS.graphs().glob("*" + GRAPH_FILETYPE):
+            if graph.is_file():
+                graph.unlink(missing_ok=True)
+        return
+
+    dir_fd = os.open(PG_PATHS.graphs(), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        with os.scandir(dir_fd) as entries:
+            for entry in entries:
+                if not entry.name.endswith(GRAPH_FILETYPE):
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    os.unlink(entry.name, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
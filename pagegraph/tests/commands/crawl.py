@@ -1,11 +1,19 @@
-import json
+from concurrent.futures import as_completed, ThreadPoolExecutor
+import os
 import pathlib
 import subprocess
 from typing import Optional
 
 
+# Each crawl job is the URL to crawl, and the path to write the graph to.
+CrawlJob = tuple[str, pathlib.Path]
+
+DEFAULT_MAX_WORKERS = min(os.cpu_count() or 1, 10)
+
+
 def run(pg_crawl_path: pathlib.Path, test_url: str, output_path: pathlib.Path,
-        verbose: bool = False, other_args: Optional[list[str]] = None) -> None:
+        verbose: bool = False, other_args: Optional[list[str]] = None,
+        timeout: Optional[int] = None) -> None:
     pg_crawl_cmd = [
         "npm", "run", "crawl", "--",
         "-u", test_url,
@@ -22,59 +30,24 @@ def run(pg_crawl_path: pathlib.Path, test_url: str, output_path: pathlib.Path,
     stdout_option = None if verbose else subprocess.DEVNULL
     subprocess.run(pg_crawl_cmd, stdout=stdout_option,
                    stderr=subprocess.PIPE, check=True,
-                   cwd=pg_crawl_path)
-
-
-def validate_path(path: str) -> pathlib.Path:
-    # First sanity check that the given path was for a node based
-    # git repo at all.
-    tool_path = pathlib.Path(path)
-    if not tool_path.is_dir():
-        raise ValueError(
-            f"Invalid pagegraph-crawl path: {tool_path} is not a directory")
-    package_path = tool_path / "package.json"
-    if not package_path.is_file():
-        raise ValueError(
-            f"Invalid pagegraph-crawl project: {package_path} is not a file")
-
-    # And do some simple checks to make sure it looks like its for
-    # the 'pagegraph-crawl' repo.
-    with package_path.open("r") as handle:
+                   cwd=pg_crawl_path, timeout=timeout)
+
+
+def run_many(pg_crawl_path: pathlib.Path, jobs: list[CrawlJob],
+             verbose: bool = False, other_args: Optional[list[str]] = None,
+             max_workers: int = DEFAULT_MAX_WORKERS,
+             timeout: Optional[int] = None) -> None:
+    # Each crawl runs in its own `npm` / Brave child process, so threads
+    # are enough here; the workers just wait on their child process.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(run, pg_crawl_path, test_url, output_path,
+                            verbose, other_args, timeout)
+            for test_url, output_path in jobs
+        ]
         try:
-            package_data = json.load(handle)
-        except json.JSONDecodeError as exc:
-            msg = f"Invalid pagegraph-crawl project: {package_path} is not JSON"
-            raise ValueError(msg) from exc
-        if package_data["name"] != "pagegraph-crawl":
-            msg = (f"Invalid pagegraph-crawl project: {package_path} is not "
-                "for the pagegraph-crawl project. "
-                "key \"name\" does not have value \"pagegraph-crawl\".")
-            raise ValueError(msg)
-
-    # Next, do a basic check to see if it looks like pagegraph-crawl
-    # has been built. If not, we can try the basic steps to build
-    # it ourselves.
-    built_run_path = tool_path / "built/run.js"
-    if not built_run_path.is_file():
-        try:
-            subprocess.run(["npm", "install"], cwd=tool_path, check=True,
-                           stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        except subprocess.CalledProcessError as exc:
-            msg = ("Invalid pagegraph-crawl project: project is not built, "
-                  "and `npm install` failed when we tried to run it for you.")
-            raise ValueError(msg) from exc
-
-        try:
-            subprocess.run(["npm", "run", "build"], cwd=tool_path, check=True,
-                           stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        except subprocess.CalledProcessError as exc:
-            msg = ("Invalid pagegraph-crawl project: project is not built, " +
-                  "and `npm run build` failed when we tried to run it for you.")
-            raise ValueError(msg) from exc
-
-        if not built_run_path.is_file():
-            msg = ("Invalid pagegraph-crawl project: tried building the "
-                f"project for you, but didn't find expected {built_run_path} "
-                "file, so something went wrong.")
-            raise ValueError(msg)
-    return tool_path
+            for future in as_completed(futures):
+                future.result()
+        except subprocess.SubprocessError:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
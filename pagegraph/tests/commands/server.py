@@ -1,9 +1,28 @@
 
 from __future__ import annotations
 
+from collections import deque
+from contextlib import contextmanager
 import pathlib
+import socket
 from subprocess import DEVNULL, PIPE, Popen, run
+from threading import Thread
 import time
+from typing import IO, Iterator
+
+
+DEFAULT_PORT = 8000
+READY_TIMEOUT_SECS = 2.0
+# How many of the most recent lines the server wrote to stderr to keep
+# around for diagnostics.
+STDERR_LINES_KEPT = 200
+
+# Maps the pid of each running test server to its most recent stderr lines.
+SERVER_STDERR: dict[int, deque[bytes]] = {}
+
+# Test servers shared through `session_server`, keyed by port, along with
+# how many callers are currently using each one.
+SESSION_SERVERS: dict[int | None, tuple[Popen, int]] = {}  # type: ignore[type-arg]
 
 
 def url_for_case(test_case: pathlib.Path, port: int) -> str:
@@ -40,9 +59,77 @@ def start(tests_dir: pathlib.Path,
     print("Starting test http.server")
     # pylint: disable-next=consider-using-with
     handle = Popen(start_server_cmd, stdout=stdout_option, stderr=PIPE)
-    time.sleep(2)
+
+    # http.server logs every request to stderr, so keep draining the pipe
+    # in the background; otherwise the server blocks once the pipe fills.
+    stderr_lines: deque[bytes] = deque(maxlen=STDERR_LINES_KEPT)
+    SERVER_STDERR[handle.pid] = stderr_lines
+    drain_thread = Thread(target=drain_stream,
+                          args=(handle.stderr, stderr_lines), daemon=True)
+    drain_thread.start()
+
+    ready_port = DEFAULT_PORT if port is None else port
+    if not wait_until_ready(ready_port):
+        if handle.poll() is not None:
+            # The server exited, so let the drain thread finish reading
+            # whatever it wrote before it died.
+            drain_thread.join(timeout=1)
+        server_output = b"".join(recent_stderr(handle))
+        shutdown(handle)
+        msg = (f"Test http.server did not accept connections on port "
+               f"{ready_port} within {READY_TIMEOUT_SECS} seconds")
+        if server_output:
+            msg += "\n" + server_output.decode("utf8", errors="replace")
+        raise RuntimeError(msg)
     return handle
 
 
+def wait_until_ready(port: int,
+                     timeout: float = READY_TIMEOUT_SECS) -> bool:
+    """Polls the port the test server is listening on, returning as soon
+    as a connection succeeds (or False if the timeout passes first)."""
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("localhost", port), timeout=0.05):
+                return True
+        except OSError:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
+    return False
+
+
+def drain_stream(stream: IO[bytes], lines: deque[bytes]) -> None:
+    for line in stream:
+        lines.append(line)
+
+
+def recent_stderr(handle: Popen) -> list[bytes]:  # type: ignore[type-arg]
+    return list(SERVER_STDERR.get(handle.pid, []))
+
+
 def shutdown(handle: Popen) -> None:  # type: ignore[type-arg]
     handle.terminate()
+    SERVER_STDERR.pop(handle.pid, None)
+
+
+@contextmanager
+def session_server(tests_dir: pathlib.Path, port: int | None = None,
+                   verbose: bool = False) -> Iterator[Popen]:  # type: ignore[type-arg]
+    """Starts the test server on first use, and shares that same server
+    with any nested users, only shutting it down when the last user exits."""
+    if port in SESSION_SERVERS:
+        handle, ref_count = SESSION_SERVERS[port]
+    else:
+        handle, ref_count = start(tests_dir, port, verbose), 0
+    SESSION_SERVERS[port] = (handle, ref_count + 1)
+    try:
+        yield handle
+    finally:
+        handle, ref_count = SESSION_SERVERS[port]
+        if ref_count == 1:
+            del SESSION_SERVERS[port]
+            shutdown(handle)
+        else:
+            SESSION_SERVERS[port] = (handle, ref_count - 1)
@@ -1,17 +1,62 @@
+from functools import lru_cache
 import json
 import pathlib
+import stat
 import subprocess
+from typing import Optional
 
 
-def validate_path(path: str) -> bool:
+BUILT_RUN_PATH = "built/run.js"
+
+
+def file_mtime(path: pathlib.Path) -> Optional[int]:
+    """Returns the modification time of the given path, or None if the path
+    doesn't exist or isn't a regular file."""
+    try:
+        path_stat = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(path_stat.st_mode):
+        return None
+    return path_stat.st_mtime_ns
+
+
+def validate_path(path: str) -> pathlib.Path:
+    # The checks below read and parse package.json, and may build the
+    # project, so only redo them if package.json or the built crawler
+    # has changed since the last time the path was validated. These two
+    # stat() calls also tell us whether each file exists, so the checks
+    # below only need to touch the filesystem again to explain why
+    # validation failed, or to build the project.
+    tool_path = pathlib.Path(path).resolve()
+    package_mtime = file_mtime(tool_path / "package.json")
+    built_mtime = file_mtime(tool_path / BUILT_RUN_PATH)
+    if built_mtime is None:
+        # The project hasn't been built (or the build was removed), so
+        # check and build it without caching the result; the next call
+        # will see the new build and can be cached.
+        return check_project(tool_path, package_mtime)
+    return check_built_project(tool_path, package_mtime, built_mtime)
+
+
+@lru_cache(maxsize=8)
+def check_built_project(tool_path: pathlib.Path, package_mtime: Optional[int],
+                        built_mtime: int) -> pathlib.Path:
+    # `built_mtime` is only here to be part of the cache key, so that
+    # rebuilding or removing the crawler invalidates the cached result.
+    del built_mtime
+    return check_project(tool_path, package_mtime)
+
+
+def check_project(tool_path: pathlib.Path,
+                  package_mtime: Optional[int]) -> pathlib.Path:
     # First sanity check that the given path was for a node based
     # git repo at all.
-    tool_path = pathlib.Path(path)
-    if not tool_path.is_dir():
-        raise ValueError(
-            f"Invalid pagegraph-crawl path: {tool_path} is not a directory")
     package_path = tool_path / "package.json"
-    if not package_path.is_file():
+    if package_mtime is None:
+        if not tool_path.is_dir():
+            raise ValueError(
+                f"Invalid pagegraph-crawl path: {tool_path} is not a directory")
         raise ValueError(
             f"Invalid pagegraph-crawl project: {package_path} is not a file")
 
@@ -32,22 +77,24 @@ def validate_path(path: str) -> bool:
     # Next, do a basic check to see if it looks like pagegraph-crawl
     # has been built. If not, we can try the basic steps to build
     # it ourselves.
-    built_run_path = tool_path / "built/run.js"
+    built_run_path = tool_path / BUILT_RUN_PATH
     if not built_run_path.is_file():
         try:
             subprocess.run(["npm", "install"], cwd=tool_path, check=True,
-                           stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         except subprocess.CalledProcessError as exc:
             msg = ("Invalid pagegraph-crawl project: project is not built, "
                 "and `npm install` failed when we tried to run it for you.")
+            msg += "\n" + exc.stderr.decode("utf8", errors="replace")
             raise ValueError(msg) from exc
 
         try:
             subprocess.run(["npm", "run", "build"], cwd=tool_path, check=True,
-                           stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         except subprocess.CalledProcessError as exc:
             msg = ("Invalid pagegraph-crawl project: project is not built, "
                 "and `npm run build` failed when we tried to run it for you.")
+            msg += "\n" + exc.stderr.decode("utf8", errors="replace")
             raise ValueError(msg) from exc
 
         if not built_run_path.is_file():
@@ -55,4 +102,4 @@ def validate_path(path: str) -> bool:
                 "Invalid pagegraph-crawl project: tried building the project "
                 f"for you, but didn't find expected {built_run_path} file, "
                 "so something went wrong.")
-    return True
+    return tool_path
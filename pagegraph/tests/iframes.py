@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from pagegraph.urls import security_origin_from_url
 from pagegraph.tests import PageGraphBaseTestClass
@@ -17,11 +17,11 @@ class IFramesBasicTestCase(PageGraphBaseTestClass):
     NAME = "iframes-about_blank"
 
     def test_num_iframes(self) -> None:
-        frame_nodes = self.graph.iframe_nodes()
+        frame_nodes = self.iframe_nodes()
         self.assertEqual(len(frame_nodes), 1)
 
     def test_num_domroots(self) -> None:
-        frame_nodes = self.graph.iframe_nodes()
+        frame_nodes = self.iframe_nodes()
         iframe_node = frame_nodes[0]
         domroot_nodes = iframe_node.child_domroot_nodes()
         self.assertEqual(len(domroot_nodes), 2)
@@ -50,11 +50,11 @@ class IFramesNavigationTestCase(PageGraphBaseTestClass):
     NAME = "iframes-navigation"
 
     def test_num_iframes(self) -> None:
-        frame_nodes = self.graph.iframe_nodes()
+        frame_nodes = self.iframe_nodes()
         self.assertEqual(len(frame_nodes), 1)
 
     def test_parser_generated_frame(self) -> None:
-        frame_nodes = self.graph.iframe_nodes()
+        frame_nodes = self.iframe_nodes()
         iframe_node = frame_nodes[0]
 
         # There should be three child documents in the iframe:
@@ -69,13 +69,16 @@ class IFramesNavigationTestCase(PageGraphBaseTestClass):
         about_blank_domroot = None
         dest_domroot = None
         for node in domroot_nodes:
-            if FRAME_URL in node.url():
+            node_url = node.url()
+            if FRAME_URL in node_url:
                 dest_domroot = node
-            elif node.url() == ABOUT_BLANK_URL:
+            elif node_url == ABOUT_BLANK_URL:
                 if node.is_init_domroot():
                     init_domroot = node
                 else:
                     about_blank_domroot = node
+            if init_domroot and about_blank_domroot and dest_domroot:
+                break
         self.assertIsNotNone(init_domroot)
         self.assertIsNotNone(about_blank_domroot)
         self.assertIsNotNone(dest_domroot)
@@ -92,9 +95,15 @@ class IFramesNavigationTestCase(PageGraphBaseTestClass):
 
 class IFramesSecurityOriginsTestCase(PageGraphBaseTestClass):
     NAME = "iframes-security_origin"
+    top_security_origin: Optional[Url]
 
-    def graph_security_origin(self) -> Url:
-        return security_origin_from_url(self.graph.url)
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.top_security_origin = security_origin_from_url(cls.graph.url)
+
+    def graph_security_origin(self) -> Optional[Url]:
+        return self.top_security_origin
 
     def test_top_frame_security_origin(self) -> None:
         top_level_frame = self.graph.get_elements_by_id("frame1")
@@ -129,11 +138,11 @@ class IFramesSubDocumentTestCase(PageGraphBaseTestClass):
     NAME = "iframes-sub_document"
 
     def test_num_iframes(self) -> None:
-        frame_nodes = self.graph.iframe_nodes()
+        frame_nodes = self.iframe_nodes()
         self.assertEqual(len(frame_nodes), 1)
 
     def test_text_frame_with_src(self) -> None:
-        frame_nodes = self.graph.iframe_nodes()
+        frame_nodes = self.iframe_nodes()
         iframe_node = frame_nodes[0]
 
         domroot_nodes = iframe_node.child_domroot_nodes()
@@ -142,10 +151,13 @@ class IFramesSubDocumentTestCase(PageGraphBaseTestClass):
         init_domroot = None
         dest_domroot = None
         for node in domroot_nodes:
-            if ABOUT_BLANK_URL in node.url():
+            node_url = node.url()
+            if ABOUT_BLANK_URL in node_url:
                 init_domroot = node
-            elif FRAME_URL in node.url():
+            elif FRAME_URL in node_url:
                 dest_domroot = node
+            if init_domroot and dest_domroot:
+                break
 
         self.assertIsNotNone(init_domroot)
         self.assertIsNotNone(dest_domroot)
@@ -157,19 +169,19 @@ class IFramesIsSecurityOriginInheritingTestCase(PageGraphBaseTestClass):
     NAME = "iframes-is_security_origin_inheriting"
 
     def test_initial_about_blank(self) -> None:
-        frame = self.graph.get_elements_by_id("frame1")[0]
+        frame = self.frame_by_id("frame1")
         self.assertTrue(frame.is_security_origin_inheriting())
 
     def test_initial_remote_origin(self) -> None:
-        frame = self.graph.get_elements_by_id("frame2")[0]
+        frame = self.frame_by_id("frame2")
         self.assertFalse(frame.is_security_origin_inheriting())
 
     def test_nested_about_blank(self) -> None:
-        frame = self.graph.get_elements_by_id("frame3")[0]
+        frame = self.frame_by_id("frame3")
         self.assertTrue(frame.is_security_origin_inheriting())
 
     def test_nested_remote_origin(self) -> None:
-        frame = self.graph.get_elements_by_id("frame4")[0]
+        frame = self.frame_by_id("frame4")
         self.assertFalse(frame.is_security_origin_inheriting())
 
 
@@ -177,15 +189,15 @@ class IFramesIsThirdPartyToRootTestCase(PageGraphBaseTestClass):
     NAME = "iframes-is_third_party_to_root"
 
     def test_about_blank_frame(self) -> None:
-        frame = self.graph.get_elements_by_id("frame1")[0]
+        frame = self.frame_by_id("frame1")
         self.assertFalse(frame.is_third_party_to_root())
 
     def test_remote_origin_frame(self) -> None:
-        frame = self.graph.get_elements_by_id("frame2")[0]
+        frame = self.frame_by_id("frame2")
         self.assertTrue(frame.is_third_party_to_root())
 
     def test_local_origin_frame(self) -> None:
-        frame = self.graph.get_elements_by_id("frame3")[0]
+        frame = self.frame_by_id("frame3")
         self.assertFalse(frame.is_third_party_to_root())
 
 
@@ -193,21 +205,21 @@ class IFramesIsTopLevelDOMRootTestCase(PageGraphBaseTestClass):
     NAME = "iframes-is_top_level_domroot"
 
     def test_initial_about_blank_frame(self) -> None:
-        frame = self.graph.get_elements_by_id("frame1")[0]
+        frame = self.frame_by_id("frame1")
         domroot_node = frame.domroot_node()
         self.assertFalse(domroot_node.is_top_level_domroot())
 
     def test_parent_of_initial_about_blank_frame(self) -> None:
-        frame = self.graph.get_elements_by_id("frame1")[0]
+        frame = self.frame_by_id("frame1")
         domroot_node = frame.execution_context()
         self.assertTrue(domroot_node.is_top_level_domroot())
 
     def test_nested_injected_iframe(self) -> None:
-        frame = self.graph.get_elements_by_id("frame2")[0]
+        frame = self.frame_by_id("frame2")
         domroot_node = frame.domroot_node()
         self.assertFalse(domroot_node.is_top_level_domroot())
 
     def test_nested_srcdoc_iframe(self) -> None:
-        frame = self.graph.get_elements_by_id("frame3")[0]
+        frame = self.frame_by_id("frame3")
         domroot_node = frame.domroot_node()
         self.assertFalse(domroot_node.is_top_level_domroot())
@@ -55,11 +55,11 @@ class LocalStorageCrossFrameTestCase(PageGraphBaseTestClass):
         self.assertEqual(len(storage_set_edges), 2)
 
         top_domroots = self.graph.toplevel_domroot_nodes()
-        toplevel_frame_ids = [x.frame_id() for x in top_domroots]
+        toplevel_frame_ids = {x.frame_id() for x in top_domroots}
 
-        iframe_elm = self.graph.iframe_nodes()[0]
+        iframe_elm = self.iframe_nodes()[0]
         child_domroots = iframe_elm.child_domroot_nodes()
-        child_frame_ids = [x.frame_id() for x in child_domroots]
+        child_frame_ids = {x.frame_id() for x in child_domroots}
 
         parent_frame_edge = None
         child_frame_edge = None
@@ -74,5 +74,5 @@ class LocalStorageCrossFrameTestCase(PageGraphBaseTestClass):
         self.assertIsNotNone(parent_frame_edge)
         self.assertIsNotNone(child_frame_edge)
 
-        self.assertTrue(parent_frame_edge.frame_id() in toplevel_frame_ids)
-        self.assertTrue(child_frame_edge.frame_id() in child_frame_ids)
+        self.assertIn(parent_frame_edge.frame_id(), toplevel_frame_ids)
+        self.assertIn(child_frame_edge.frame_id(), child_frame_ids)
@@ -0,0 +1,20 @@
+import subprocess
+import sys
+import unittest
+
+import pagegraph.tests.util.paths as PG_PATHS
+
+
+# pylint: disable=too-few-public-methods
+class RunWorkersTestCase(unittest.TestCase):
+    # Only matches a test in localstorage.py, so every other test file
+    # (including this one) runs no tests in its worker process.
+    FILTER = "test_storage_delete"
+
+    def test_filter_with_workers(self) -> None:
+        tests_script = PG_PATHS.project_root() / "tests.py"
+        result = subprocess.run(
+            [sys.executable, str(tests_script), "run",
+             "--filter", self.FILTER, "--workers", "2"],
+            capture_output=True, check=False)
+        self.assertEqual(result.returncode, 0, result.stderr)
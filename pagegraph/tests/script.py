@@ -6,11 +6,7 @@ class ScriptCrossDomTestCase(PageGraphBaseTestClass):
     NAME = "script-cross_dom"
 
     def test_par_domroots(self) -> None:
-        html_nodes = self.graph.html_nodes()
-        par_nodes = []
-        for node in html_nodes:
-            if node.tag_name() == "P":
-                par_nodes.append(node)
+        par_nodes = self.graph.html_nodes_by_tag("P")
         self.assertEqual(len(par_nodes), 1)
 
         par_node = par_nodes[0]
@@ -22,21 +18,19 @@ class ScriptCrossDomTestCase(PageGraphBaseTestClass):
         self.assertEqual(document_frame_id, frame_id)
 
 
-# pylint: disable=too-few-public-methods
 class ScriptJsCallsTestCase(PageGraphBaseTestClass):
     NAME = "script-js_calls"
 
     def test_num_scripts(self) -> None:
         child_frame_url = "assets/frames/script_js-calls_child_frame.html"
-        main_domroot = None
-        toplevel_domroot_nodes = self.graph.toplevel_domroot_nodes()
-        for node in toplevel_domroot_nodes:
-            if ScriptJsCallsTestCase.NAME in node.url():
-                main_domroot = node
-                break
-
+        main_domroot = self.graph.toplevel_domroot_with_url_containing(
+            ScriptJsCallsTestCase.NAME)
         self.assertIsNotNone(main_domroot)
-        child_domroots = main_domroot.domroot_nodes(func=lambda x: child_frame_url in x.url())
+
+        child_domroots = [
+            node for node in main_domroot.domroot_nodes()
+            if child_frame_url in node.url()
+        ]
         self.assertEqual(len(child_domroots), 1)
 
         raw_main_frame_scripts = main_domroot.scripts_executed_from()
@@ -49,8 +43,24 @@ class ScriptJsCallsTestCase(PageGraphBaseTestClass):
         self.assertEqual(len(frame_scripts), 1)
 
         all_scripts = main_frame_scripts + frame_scripts
-        attr_sets = set()
-        for script in all_scripts:
-            for js_call_result in script.calls("Performance.now"):
-                attr_sets.add(js_call_result.pretty_print())
+        # The same things pretty_print() reports, but as a tuple, to skip
+        # formatting each call into a single string.
+        attr_sets = {
+            (js_call_result.structure.name(), str(js_call_result.args()),
+             str(js_call_result.return_value()) if js_call_result.result
+             else None)
+            for script in all_scripts
+            for js_call_result in script.calls("Performance.now")
+        }
         self.assertEqual(len(attr_sets), 5)
+
+    def test_call_results_per_structure(self) -> None:
+        # Each structure node should only report the calls made to it, so
+        # across all structure nodes, each call is reported exactly once.
+        num_call_results = 0
+        for js_node in self.graph.js_structure_nodes():
+            for js_call_result in js_node.call_results():
+                self.assertEqual(js_call_result.call.outgoing_node(), js_node)
+                num_call_results += 1
+        num_call_edges = len(list(self.graph.js_call_edges()))
+        self.assertEqual(num_call_results, num_call_edges)
@@ -1,47 +1,55 @@
 # Tools for removing things Brave injects browser side from graphs,
 # to make test results better match expectations.
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from pagegraph.graph.node import Node
 
 if TYPE_CHECKING:
     from pagegraph.graph import PageGraph
     from pagegraph.graph.edge import Edge
-    from pagegraph.graph.node import Node
+    from pagegraph.types import PageGraphEdgeId, PageGraphNodeId
+
+    ArtifactIds = tuple[frozenset[PageGraphNodeId], frozenset[PageGraphEdgeId]]
 
 
 ELM_PICKER_SCRIPT_NEEDLE = "./components/brave_extension/extension/brave_extension/content_element_picker.ts"
-HAS_CACHED: bool = False
-ARTIFACT_NODES: set["Node"] = set()
-ARTIFACT_EDGES: set["Edge"] = set()
-
-
-def build_caches(pg: "PageGraph") -> None:
-    global HAS_CACHED
-    if HAS_CACHED:
-        return
-    script_nodes = pg.script_local_nodes()
-    for node in script_nodes:
-        if ELM_PICKER_SCRIPT_NEEDLE in node.source():
-            ARTIFACT_NODES.add(node)
-            for edge in node.incoming_edges():
-                ARTIFACT_EDGES.add(edge)
-    HAS_CACHED = True
-
-
-def filter_artifact_nodes(pg: "PageGraph", nodes: list["Node"]) -> list["Node"]:
-    build_caches(pg)
-    filtered_nodes = []
-    for node in nodes:
-        if node in ARTIFACT_NODES:
-            continue
-        filtered_nodes.append(node)
-    return filtered_nodes
-
-
-def filter_artifact_edges(pg: "PageGraph", edges: list["Edge"]) -> list["Edge"]:
-    build_caches(pg)
-    filtered_edges = []
-    for edge in edges:
-        if edge in ARTIFACT_EDGES:
-            continue
-        filtered_edges.append(edge)
-    return filtered_edges
+
+# Maps each graph to the ids of the artifact nodes and edges in that graph.
+ARTIFACT_CACHE: "WeakKeyDictionary[PageGraph, ArtifactIds]" = WeakKeyDictionary()
+
+
+def compute_artifact_ids(pg: "PageGraph") -> "ArtifactIds":
+    node_ids = set()
+    edge_ids = set()
+    source_attr = Node.RawAttrs.SOURCE.value
+    for node in pg.script_local_nodes():
+        # Read the raw source attribute straight from the NetworkX node
+        # data, since most scripts won't match and we don't need any of
+        # the other handling `ScriptLocalNode.source()` does.
+        source = pg.graph.nodes[node.pg_id()].get(source_attr, "")
+        if ELM_PICKER_SCRIPT_NEEDLE in source:
+            node_ids.add(node.pg_id())
+            # Only the ids of the incoming edges are needed, so read the
+            # edge keys from NetworkX, rather than building Edge objects.
+            for _, _, edge_id in pg.graph.in_edges(node.pg_id(), keys=True):
+                edge_ids.add(edge_id)
+    return frozenset(node_ids), frozenset(edge_ids)
+
+
+def build_caches(pg: "PageGraph") -> "ArtifactIds":
+    if pg not in ARTIFACT_CACHE:
+        ARTIFACT_CACHE[pg] = compute_artifact_ids(pg)
+    return ARTIFACT_CACHE[pg]
+
+
+def filter_artifact_nodes(pg: "PageGraph",
+                          nodes: Iterable["Node"]) -> list["Node"]:
+    artifact_node_ids, _ = build_caches(pg)
+    return [node for node in nodes if node.pg_id() not in artifact_node_ids]
+
+
+def filter_artifact_edges(pg: "PageGraph",
+                          edges: Iterable["Edge"]) -> list["Edge"]:
+    _, artifact_edge_ids = build_caches(pg)
+    return [edge for edge in edges if edge.pg_id() not in artifact_edge_ids]
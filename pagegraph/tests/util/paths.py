@@ -8,15 +8,21 @@ THIS_FILE = pathlib.Path(abspath(str(getsourcefile(lambda: 0))))
 TESTS_CODE_DIR = THIS_FILE.parent.parent
 PROJECT_ROOT_DIR = TESTS_CODE_DIR.parent
 TEST_ASSETS_DIR = PROJECT_ROOT_DIR / "tests/assets"
+TESTCASES_DIR = TEST_ASSETS_DIR / "html"
+GRAPHS_DIR = TEST_ASSETS_DIR / "graphs"
 
 
 def testcases() -> pathlib.Path:
-    return TEST_ASSETS_DIR / "html"
+    return TESTCASES_DIR
 
 
 def graphs() -> pathlib.Path:
-    return TEST_ASSETS_DIR / "graphs"
+    return GRAPHS_DIR
 
 
 def unittests() -> pathlib.Path:
     return TESTS_CODE_DIR
+
+
+def project_root() -> pathlib.Path:
+    return PROJECT_ROOT_DIR
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum, StrEnum
+from enum import StrEnum
 from typing import Set, Optional, TYPE_CHECKING, Union
 
 
@@ -44,18 +44,21 @@ PageGraphEdgeKey = tuple[PageGraphNodeId, PageGraphNodeId, PageGraphEdgeId]
 Url = str
 ElementSummary = Optional[dict[str, "JSONAble"]]
 
-LeafDomNode = Union["TextNode", "FrameOwnerNode"]
-ChildDomNode = Union["HTMLNode", "TextNode", "FrameOwnerNode"]
-LocalOrRemoteScriptNode = Union["ScriptLocalNode", "ScriptRemoteNode"]
-JSCallingNode = Union["ScriptLocalNode", "UnknownNode"]
-ScriptExecutorNode = Union["ParentDOMElementNode", "ParserNode", "ScriptNode"]
-RequesterNode = Union["HTMLNode", "DOMRootNode", "LocalOrRemoteScriptNode",
-                      "ParserNode"]
-ActorNode = Union["ScriptLocalNode", "ParserNode", "UnknownNode"]
-
-RequestIncoming = Union["RequestStartEdge", "RequestRedirectEdge"]
-RequestOutgoing = Union["RequestRedirectEdge", "RequestCompleteEdge",
-                        "RequestErrorEdge"]
+# These aliases are only used in type annotations, so they're only
+# built when type checking.
+if TYPE_CHECKING:
+    LeafDomNode = Union["TextNode", "FrameOwnerNode"]
+    ChildDomNode = Union["HTMLNode", "TextNode", "FrameOwnerNode"]
+    LocalOrRemoteScriptNode = Union["ScriptLocalNode", "ScriptRemoteNode"]
+    JSCallingNode = Union["ScriptLocalNode", "UnknownNode"]
+    ScriptExecutorNode = Union["ParentDOMElementNode", "ParserNode", "ScriptNode"]
+    RequesterNode = Union["HTMLNode", "DOMRootNode", "LocalOrRemoteScriptNode",
+                          "ParserNode"]
+    ActorNode = Union["ScriptLocalNode", "ParserNode", "UnknownNode"]
+
+    RequestIncoming = Union["RequestStartEdge", "RequestRedirectEdge"]
+    RequestOutgoing = Union["RequestRedirectEdge", "RequestCompleteEdge",
+                            "RequestErrorEdge"]
 
 RequestHeaders = list[tuple[str, str]]
 
@@ -63,7 +66,7 @@ RequestHeaders = list[tuple[str, str]]
 # See third_party/blink/renderer/platform/loader/fetch/resource.h.
 # The OTHER catch all case covers the additional types
 # defined in `blink::Resource::InitiatorTypeNameToString`.
-class ResourceType(Enum):
+class ResourceType(StrEnum):
     ATTRIBUTION_RESOURCE = "Attribution resource"
     AUDIO = "Audio"
     CSS_RESOURCE = "CSS resource"
@@ -95,8 +98,18 @@ class ResourceType(Enum):
     XSL_STYLESHEET = "XSL stylesheet"
     OTHER = "Other"  # Fallback / catchall case
 
+    @classmethod
+    def from_str(cls, value: str) -> ResourceType:
+        """Returns the resource type with the given Blink name, or
+        ResourceType.OTHER if the name isn't one we know about."""
+        return RESOURCE_TYPE_BY_VALUE.get(value, cls.OTHER)
 
-@dataclass
+
+RESOURCE_TYPE_BY_VALUE: dict[str, ResourceType] = {
+    member.value: member for member in ResourceType}
+
+
+@dataclass(slots=True)
 class FrameSummary:
     created_nodes: Set[Node]
     attached_nodes: Set[ChildDomNode]
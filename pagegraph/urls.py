@@ -1,4 +1,5 @@
-from urllib.parse import urlparse
+from functools import lru_cache
+from urllib.parse import urlparse, ParseResult
 from typing import Optional
 
 from publicsuffix2 import get_sld
@@ -6,10 +7,18 @@ from publicsuffix2 import get_sld
 from pagegraph.types import Url
 
 
-LOCAL_FRAME_URLS = (
+LOCAL_FRAME_URLS: frozenset[Url] = frozenset({
      "about:blank",
      "about:srcdoc",
-)
+})
+
+
+@lru_cache(maxsize=4096)
+def parse_url(url: Url) -> ParseResult:
+    """Memoized urlparse(), since the same frame URLs get compared against
+    each other over and over when walking a graph."""
+    return urlparse(url)
+
 
 def is_security_origin_inheriting_url(url: Url) -> bool:
     return url in LOCAL_FRAME_URLS
@@ -30,10 +39,10 @@ def are_urls_same_site(url: Url, other_url: Url) -> bool:
 
 
 def is_url_local(url: Url, context_url: Url) -> bool:
-    if is_security_origin_inheriting_url(url):
+    if url == context_url or is_security_origin_inheriting_url(url):
         return True
-    url_parts = urlparse(url)
-    context_url_parts = urlparse(context_url)
+    url_parts = parse_url(url)
+    context_url_parts = parse_url(context_url)
     if url_parts.netloc in ("", context_url_parts.netloc):
         return True
     return False
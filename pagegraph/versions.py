@@ -25,8 +25,8 @@ PG_FEATURE_MIN_VERSION_MAPPING: dict[Feature, Version] = {
 
 
 def min_version_for_feature(feature: Feature) -> Version:
-    try:
-        return PG_FEATURE_MIN_VERSION_MAPPING[feature]
-    except KeyError as exc:
+    min_version = PG_FEATURE_MIN_VERSION_MAPPING.get(feature)
+    if min_version is None:
         msg = f"Feature '{feature}' not tied to any version"
-        raise ValueError(msg) from exc
+        raise ValueError(msg)
+    return min_version
@@ -6,249 +6,266 @@ import pathlib
 import sys
 
 import pagegraph.commands
-import pagegraph.commands.element
-import pagegraph.commands.html
-import pagegraph.commands.js_calls
-import pagegraph.commands.requests
-import pagegraph.commands.scripts
-import pagegraph.commands.subframes
-import pagegraph.commands.unknown
-import pagegraph.commands.validate
 import pagegraph.serialize
 import pagegraph.types
 from pagegraph import __version__
 
 
-# pylint: disable=too-many-return-statements
+# Each command module is only imported when that command is run, so that
+# a single invocation doesn't pay to import every command.
+# pylint: disable=too-many-return-statements,import-outside-toplevel
 def get_command(args: argparse.Namespace) -> pagegraph.commands.Command:
     match args.command_name:
         case "subframes":
-            return pagegraph.commands.subframes.Command(
+            from pagegraph.commands import subframes
+            return subframes.Command(
                 args.input, args.local, args.party_filter, args.debug)
         case "validate":
-            return pagegraph.commands.validate.Command(args.input)
+            from pagegraph.commands import validate
+            return validate.Command(args.input)
         case "requests":
-            return pagegraph.commands.requests.Command(
+            from pagegraph.commands import requests
+            return requests.Command(
                 args.input, args.frame, args.debug)
         case "scripts":
-            return pagegraph.commands.scripts.Command(
+            from pagegraph.commands import scripts
+            return scripts.Command(
                 args.input, args.frame, args.id, args.source,
                 args.omit_executors, args.debug)
         case "js_calls":
-            return pagegraph.commands.js_calls.Command(
+            from pagegraph.commands import js_calls
+            return js_calls.Command(
                 args.input, args.frame, args.cross, args.method, args.id,
                 args.debug)
         case "element":
-            return pagegraph.commands.element.Command(
+            from pagegraph.commands import element
+            return element.Command(
                 args.input, args.id, args.depth, args.graphml, args.debug)
         case "html":
-            return pagegraph.commands.html.Command(
+            from pagegraph.commands import html
+            return html.Command(
                 args.input, args.frame, args.at_serialization,
                 args.body_content, args.debug)
         case "unknown":
-            return pagegraph.commands.unknown.Command(args.input)
+            from pagegraph.commands import unknown
+            return unknown.Command(args.input)
         case _:
             raise ValueError(f"Unknown command name: {args.command_name}")
 
 
-PARSER = argparse.ArgumentParser(
-    prog="PageGraph Query",
-    description="Extracts information about a Web page's execution from "
-                " a PageGraph recordings.",
-    formatter_class=argparse.ArgumentDefaultsHelpFormatter)
-
-PARSER.add_argument(
-    "--version",
-    action="version",
-    version=f"%(prog)s {__version__}")
-PARSER.add_argument("--debug", action="store_true", default=False)
-PARSER.set_defaults(command_name="")
-
-SUBPARSERS = PARSER.add_subparsers(required=True)
-
-SUBFRAMES_PARSER = SUBPARSERS.add_parser(
-    "subframes",
-    help="Print information about subframes created and loaded by page.")
-SUBFRAMES_PARSER.add_argument(
-    "input",
-    type=pathlib.Path,
-    help="Path to PageGraph recording.")
-SUBFRAMES_PARSER.add_argument(
-    "-l", "--local",
-    action="store_true",
-    help="Print information about frames that are inherit their parent "
-         "frame's security context (i.e., about:blank, about:srcdoc) at "
-         "serialization time.")
-SUBFRAMES_PARSER.add_argument(
-    "--party-filter",
-    choices=pagegraph.types.PartyFilterOption,
-    default=pagegraph.types.PartyFilterOption.NONE.value,
-    help="Only return frames that have the same (first-party) or different "
-         "(third-party) security origin as the top-level document.")
-SUBFRAMES_PARSER.set_defaults(command_name="subframes")
-
-VALIDATE_PARSER = SUBPARSERS.add_parser(
-    "validate",
-    help="Just runs all validation and structure checks against a graph.")
-VALIDATE_PARSER.add_argument(
-    "input",
-    type=pathlib.Path,
-    help="Path to PageGraph recording.")
-VALIDATE_PARSER.set_defaults(command_name="validate")
-
-REQUEST_PARSER = SUBPARSERS.add_parser(
-    "requests",
-    help="Print information about requests made during page execution.")
-REQUEST_PARSER.add_argument(
-    "input",
-    type=pathlib.Path,
-    help="Path to PageGraph recording.")
-REQUEST_PARSER.add_argument(
-    "-f", "--frame",
-    default=None,
-    help="Only print information about requests made in a specific frame "
-         "(as described by PageGraph node ids, in the format 'n##').")
-REQUEST_PARSER.set_defaults(command_name="requests")
-
-SCRIPTS_PARSER = SUBPARSERS.add_parser(
-    "scripts",
-    help="Print information about JS units executed during page execution.")
-SCRIPTS_PARSER.add_argument(
-    "input",
-    type=pathlib.Path,
-    help="Path to PageGraph recording.")
-SCRIPTS_PARSER.add_argument(
-    "-i", "--id",
-    default=None,
-    help="If provided, only print information about JS units with the given "
-         "ID (as described by PageGraph node ids, in the format 'n##').")
-SCRIPTS_PARSER.add_argument(
-    "-s", "--source",
-    default=False,
-    action="store_true",
-    help="If included, also include script source in each report.")
-SCRIPTS_PARSER.add_argument(
-    "-f", "--frame",
-    default=None,
-    help="Only include JS code units executed in a particular frame "
-         "context (as described by PageGraph node ids, in the format 'n##'). "
-         "Note that this filters on the calling frame context, not the "
-         "receiving frame context, which will differ in some cases, such as "
-         "same-origin cross-frame calls.")
-SCRIPTS_PARSER.add_argument(
-    "-o", "--omit-executors",
-    default=False,
-    action="store_true",
-    help="If included, do not append information about why or how each script "
-         "was executed.")
-SCRIPTS_PARSER.set_defaults(command_name="scripts")
-
-JS_CALLS_PARSER = SUBPARSERS.add_parser(
-    "js-calls",
-    help="Print information about JS calls made during page execution.")
-JS_CALLS_PARSER.add_argument(
-    "input",
-    type=pathlib.Path,
-    help="Path to PageGraph recording.")
-JS_CALLS_PARSER.add_argument(
-    "-f", "--frame",
-    default=None,
-    help="Only include JS calls made by code running in this frame's context "
-         "(as described by PageGraph node ids, in the format 'n##'). "
-         "Note that this filters on the calling frame context, not the "
-         "receiving frame context, which will differ in some cases, such as "
-         "same-origin cross-frame calls.")
-JS_CALLS_PARSER.add_argument(
-    "-c", "--cross",
-    default=False,
-    action="store_true",
-    help="Only include JS calls where the calling frame context and the "
-         "receiving frame context differ.")
-JS_CALLS_PARSER.add_argument(
-    "-m", "--method",
-    default=None,
-    help="Only include JS calls where the function or method being called "
-         "includes this value as a substring.")
-JS_CALLS_PARSER.add_argument(
-    "-i", "--id",
-    default=None,
-    help="If provided, only print information about JS calls made by the "
-         "Script node with the given ID "
-         "(as described by PageGraph node ids, in the format 'n##').")
-JS_CALLS_PARSER.set_defaults(command_name="js_calls")
-
-ELEMENT_QUERY_PARSER = SUBPARSERS.add_parser(
-    "elm",
-    help="Print information about a node or edge in the graph.")
-ELEMENT_QUERY_PARSER.add_argument(
-    "input",
-    type=pathlib.Path,
-    help="Path to PageGraph recording.")
-ELEMENT_QUERY_PARSER.add_argument(
-    "id",
-    help="The id of the node to print information about "
-         "(as described by PageGraph node ids, in the format 'n##')")
-ELEMENT_QUERY_PARSER.add_argument(
-    "-d", "--depth",
-    default=1,
-    type=int,
-    help="Depth of the recursion to summarize in the graph. Defaults to 1 "
-         "(only print detailed information about target element).")
-ELEMENT_QUERY_PARSER.add_argument(
-    "--graphml", "-g",
-    type=pathlib.Path,
-    help="Write the element (and its surrounding subgraph, as determined by "
-         "the depth argument) to disk as a graphml encoded graph at the given "
-         "path.")
-ELEMENT_QUERY_PARSER.set_defaults(command_name="element")
-
-HTML_QUERY_PARSER = SUBPARSERS.add_parser(
-    "html",
-    help="Print information about the HTML elements in a document.")
-HTML_QUERY_PARSER.add_argument(
-    "input",
-    type=pathlib.Path,
-    help="Path to PageGraph recording.")
-HTML_QUERY_PARSER.add_argument(
-    "-f", "--frame",
-    default=None,
-    help="Only include HTML elements that were inserted into the document in "
-         "a given frame (as described by PageGraph node ids, in the format "
-         "'n##').")
-HTML_QUERY_PARSER.add_argument(
-    "-s", "--at-serialization",
-    default=False,
-    action="store_true",
-    help="If passed, only include HTML elements that were presented in the "
-         "document when the document was serialized (i.e., they weren't "
-         "inserted and then later deleted.).")
-HTML_QUERY_PARSER.add_argument(
-    "-b", "--body-content",
-    default=False,
-    action="store_true",
-    help="Only return elements that appear in the body of the document, "
-         "meaning elements that are a child of the <body> element.")
-HTML_QUERY_PARSER.set_defaults(command_name="html")
-
-UNKNOWN_QUERY_PARSER = SUBPARSERS.add_parser(
-    "unknown",
-    help="Print information about any events that occurred where we "
-         "could not attribute the script event to a running script. (note "
-         "this is different from the 'validate' command, which only checks "
-         "if the structure of the graph is as expected).")
-UNKNOWN_QUERY_PARSER.add_argument(
-    "input",
-    type=pathlib.Path,
-    help="Path to PageGraph recording.")
-UNKNOWN_QUERY_PARSER.set_defaults(command_name="unknown")
-
-
-try:
-    ARGS = PARSER.parse_args()
-    command = get_command(ARGS)
-    command.validate()
-    RESULT = command.execute()
-    print(command.format(RESULT))
-except ValueError as e:
-    print(f"Invalid argument: {e}", file=sys.stderr)
-    sys.exit(1)
+# pylint: disable-next=too-many-statements
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="PageGraph Query",
+        description="Extracts information about a Web page's execution from "
+                    " a PageGraph recordings.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}")
+    parser.add_argument("--debug", action="store_true", default=False)
+    parser.set_defaults(command_name="")
+
+    subparsers = parser.add_subparsers(required=True)
+
+    subframes_parser = subparsers.add_parser(
+        "subframes",
+        help="Print information about subframes created and loaded by page.")
+    subframes_parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        help="Path to PageGraph recording.")
+    subframes_parser.add_argument(
+        "-l", "--local",
+        action="store_true",
+        help="Print information about frames that are inherit their parent "
+             "frame's security context (i.e., about:blank, about:srcdoc) at "
+             "serialization time.")
+    subframes_parser.add_argument(
+        "--party-filter",
+        choices=pagegraph.types.PartyFilterOption,
+        default=pagegraph.types.PartyFilterOption.NONE.value,
+        help="Only return frames that have the same (first-party) or different "
+             "(third-party) security origin as the top-level document.")
+    subframes_parser.set_defaults(command_name="subframes")
+
+    validate_parser = subparsers.add_parser(
+        "validate",
+        help="Just runs all validation and structure checks against a graph.")
+    validate_parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        help="Path to PageGraph recording.")
+    validate_parser.set_defaults(command_name="validate")
+
+    request_parser = subparsers.add_parser(
+        "requests",
+        help="Print information about requests made during page execution.")
+    request_parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        help="Path to PageGraph recording.")
+    request_parser.add_argument(
+        "-f", "--frame",
+        default=None,
+        help="Only print information about requests made in a specific frame "
+             "(as described by PageGraph node ids, in the format 'n##').")
+    request_parser.set_defaults(command_name="requests")
+
+    scripts_parser = subparsers.add_parser(
+        "scripts",
+        help="Print information about JS units executed during page execution.")
+    scripts_parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        help="Path to PageGraph recording.")
+    scripts_parser.add_argument(
+        "-i", "--id",
+        default=None,
+        help="If provided, only print information about JS units with the given "
+             "ID (as described by PageGraph node ids, in the format 'n##').")
+    scripts_parser.add_argument(
+        "-s", "--source",
+        default=False,
+        action="store_true",
+        help="If included, also include script source in each report.")
+    scripts_parser.add_argument(
+        "-f", "--frame",
+        default=None,
+        help="Only include JS code units executed in a particular frame "
+             "context (as described by PageGraph node ids, in the format 'n##'). "
+             "Note that this filters on the calling frame context, not the "
+             "receiving frame context, which will differ in some cases, such as "
+             "same-origin cross-frame calls.")
+    scripts_parser.add_argument(
+        "-o", "--omit-executors",
+        default=False,
+        action="store_true",
+        help="If included, do not append information about why or how each script "
+             "was executed.")
+    scripts_parser.set_defaults(command_name="scripts")
+
+    js_calls_parser = subparsers.add_parser(
+        "js-calls",
+        help="Print information about JS calls made during page execution.")
+    js_calls_parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        help="Path to PageGraph recording.")
+    js_calls_parser.add_argument(
+        "-f", "--frame",
+        default=None,
+        help="Only include JS calls made by code running in this frame's context "
+             "(as described by PageGraph node ids, in the format 'n##'). "
+             "Note that this filters on the calling frame context, not the "
+             "receiving frame context, which will differ in some cases, such as "
+             "same-origin cross-frame calls.")
+    js_calls_parser.add_argument(
+        "-c", "--cross",
+        default=False,
+        action="store_true",
+        help="Only include JS calls where the calling frame context and the "
+             "receiving frame context differ.")
+    js_calls_parser.add_argument(
+        "-m", "--method",
+        default=None,
+        help="Only include JS calls where the function or method being called "
+             "includes this value as a substring.")
+    js_calls_parser.add_argument(
+        "-i", "--id",
+        default=None,
+        help="If provided, only print information about JS calls made by the "
+             "Script node with the given ID "
+             "(as described by PageGraph node ids, in the format 'n##').")
+    js_calls_parser.set_defaults(command_name="js_calls")
+
+    element_query_parser = subparsers.add_parser(
+        "elm",
+        help="Print information about a node or edge in the graph.")
+    element_query_parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        help="Path to PageGraph recording.")
+    element_query_parser.add_argument(
+        "id",
+        help="The id of the node to print information about "
+             "(as described by PageGraph node ids, in the format 'n##')")
+    element_query_parser.add_argument(
+        "-d", "--depth",
+        default=1,
+        type=int,
+        help="Depth of the recursion to summarize in the graph. Defaults to 1 "
+             "(only print detailed information about target element).")
+    element_query_parser.add_argument(
+        "--graphml", "-g",
+        type=pathlib.Path,
+        help="Write the element (and its surrounding subgraph, as determined by "
+             "the depth argument) to disk as a graphml encoded graph at the given "
+             "path.")
+    element_query_parser.set_defaults(command_name="element")
+
+    html_query_parser = subparsers.add_parser(
+        "html",
+        help="Print information about the HTML elements in a document.")
+    html_query_parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        help="Path to PageGraph recording.")
+    html_query_parser.add_argument(
+        "-f", "--frame",
+        default=None,
+        help="Only include HTML elements that were inserted into the document in "
+             "a given frame (as described by PageGraph node ids, in the format "
+             "'n##').")
+    html_query_parser.add_argument(
+        "-s", "--at-serialization",
+        default=False,
+        action="store_true",
+        help="If passed, only include HTML elements that were presented in the "
+             "document when the document was serialized (i.e., they weren't "
+             "inserted and then later deleted.).")
+    html_query_parser.add_argument(
+        "-b", "--body-content",
+        default=False,
+        action="store_true",
+        help="Only return elements that appear in the body of the document, "
+             "meaning elements that are a child of the <body> element.")
+    html_query_parser.set_defaults(command_name="html")
+
+    unknown_query_parser = subparsers.add_parser(
+        "unknown",
+        help="Print information about any events that occurred where we "
+             "could not attribute the script event to a running script. (note "
+             "this is different from the 'validate' command, which only checks "
+             "if the structure of the graph is as expected).")
+    unknown_query_parser.add_argument(
+        "input",
+        type=pathlib.Path,
+        help="Path to PageGraph recording.")
+    unknown_query_parser.set_defaults(command_name="unknown")
+
+    return parser
+
+
+def main() -> int:
+    try:
+        args = build_parser().parse_args()
+        command = get_command(args)
+        command.validate()
+        result = command.execute()
+        output = command.format(result)
+        # Reports can be very large, and are already UTF-8 encoded, so
+        # write them straight to the underlying binary stream.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.write(b"\n")
+    except ValueError as e:
+        print(f"Invalid argument: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
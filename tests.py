@@ -13,12 +13,12 @@ def serve_cmd(args: argparse.Namespace, other_args: list[str]) -> None:
 def generate_cmd(args: argparse.Namespace, other_args: list[str]) -> None:
     pagegraph.tests.commands.generate(
         args.path, args.filter, args.port, args.clear, args.verbose,
-        other_args)
+        other_args, args.workers)
 
 
 def run_cmd(args: argparse.Namespace, other_args: list[str]) -> None:
     # pylint: disable=unused-argument
-    pagegraph.tests.commands.run(args.filter, args.verbose)
+    pagegraph.tests.commands.run(args.filter, args.verbose, args.workers)
 
 
 PARSER = argparse.ArgumentParser(
@@ -64,6 +64,11 @@ GENERATE_PARSER.add_argument(
     default=False,
     action="store_true",
     help="If passed, will delete all test graphs before generating new ones.")
+GENERATE_PARSER.add_argument(
+    "--workers",
+    default=pagegraph.tests.commands.PG_CRAWL.DEFAULT_MAX_WORKERS,
+    type=int,
+    help="Number of test graphs to generate in parallel.")
 GENERATE_PARSER.add_argument(
     "--verbose",
     default=False,
@@ -83,6 +88,12 @@ RUN_PARSER.add_argument(
     default=False,
     action="store_true",
     help="If passed, report test statuses with more verbosity.")
+RUN_PARSER.add_argument(
+    "--workers",
+    default=1,
+    type=int,
+    help="If more than one, run the test files in this many parallel "
+         "processes.")
 RUN_PARSER.set_defaults(func=run_cmd)
 
 try: